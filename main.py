@@ -6,7 +6,7 @@ Sistema completo con generación automática de reportes Excel y PowerPoint
 integrando análisis de gestión de cobranza con vigencias corregidas.
 """
 
-from fastapi import FastAPI, HTTPException, Response
+from fastapi import FastAPI, HTTPException, Response, Body
 from fastapi.responses import FileResponse
 import pandas as pd
 from google.cloud import bigquery
@@ -489,7 +489,8 @@ async def root():
             "/download-powerpoint/{filename}": "🆕 Descargar archivo PowerPoint generado",
             "/validate-vigencias": "Validar lógica de vigencias",
             "/vigencias-status": "Estado de vigencias activas",
-            "/health": "Estado del sistema"
+            "/health": "Estado del sistema",
+            "/batch": "Varias consultas de estado (/, /health, /vigencias-status) en una sola llamada"
         }
     }
 
@@ -857,6 +858,38 @@ async def health_check():
     except Exception as e:
         return {"status": "unhealthy", "error": str(e)}
 
+# Consultas de estado que /batch puede resolver en una sola llamada
+BATCH_OPERATIONS = {
+    "/": root,
+    "/health": health_check,
+    "/vigencias-status": get_vigencias_status
+}
+
+@app.post("/batch")
+async def batch_status(ops: List[str] = Body(..., embed=True)):
+    """
+    Resolver varias consultas de estado en una sola llamada
+    
+    Args:
+        ops: Endpoints a consultar, por ejemplo ["/health", "/vigencias-status"]
+    
+    Returns:
+        Un resultado por operación, en el mismo orden, con su status_code y body
+    """
+    results = []
+    for op in ops:
+        handler = BATCH_OPERATIONS.get(op)
+        if handler is None:
+            results.append({"op": op, "status_code": 404, "body": {"detail": f"Operación no soportada: {op}"}})
+            continue
+        
+        try:
+            results.append({"op": op, "status_code": 200, "body": await handler()})
+        except HTTPException as e:
+            results.append({"op": op, "status_code": e.status_code, "body": {"detail": e.detail}})
+    
+    return {"results": results}
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
@@ -6,7 +6,7 @@ Módulo para generar reportes semanales automatizados en Excel y PowerPoint
 SIN dependencias problemáticas de matplotlib o compilación C.
 
 Características:
-- Generación Excel con openpyxl (sin matplotlib)
+- Generación Excel con XlsxWriter en modo constant_memory (sin matplotlib)
 - Presentaciones PowerPoint con python-pptx
 - Análisis consolidado CALL vs VOICEBOT
 - Métricas ejecutivas automatizadas
@@ -21,15 +21,16 @@ import numpy as np
 from datetime import datetime, date, timedelta
 import tempfile
 import os
+import io
+from collections import defaultdict
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from xml.sax.saxutils import escape
 from typing import Dict, List, Optional, Tuple
 import logging
 
-# Excel libraries (sin matplotlib)
-import openpyxl
-from openpyxl.styles import Font, PatternFill, Border, Side, Alignment
-from openpyxl.utils.dataframe import dataframe_to_rows
-from openpyxl.chart import BarChart, LineChart, Reference
-from openpyxl.worksheet.table import Table, TableStyleInfo
+# Excel library (sin matplotlib) - escritura con xlsxwriter
 import xlsxwriter
 
 # PowerPoint libraries
@@ -38,9 +39,84 @@ from pptx.util import Inches, Pt
 from pptx.enum.text import MSO_ANCHOR, MSO_AUTO_SIZE
 from pptx.dml.color import RGBColor
 from pptx.enum.shapes import MSO_SHAPE
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
 
 logger = logging.getLogger(__name__)
 
+# Tamaños de fuente PowerPoint (se crean una sola vez, no en cada párrafo)
+PPT_SIZE_PORTADA = Pt(32)
+PPT_SIZE_TITULO = Pt(28)
+PPT_SIZE_SECCION = Pt(20)
+PPT_SIZE_SUBTITULO = Pt(18)
+PPT_SIZE_TEXTO = Pt(16)
+PPT_SIZE_DETALLE = Pt(14)
+
+# Geometría de la slide de canales (EMU precalculados)
+PPT_MARGEN_IZQ = Inches(0.5)
+PPT_TITULO_TOP = Inches(0.5)
+PPT_TITULO_WIDTH = Inches(9)
+PPT_TITULO_HEIGHT = Inches(1)
+PPT_CANAL_TOP = Inches(2)
+PPT_CANAL_VB_LEFT = Inches(5)
+PPT_CANAL_WIDTH = Inches(4)
+PPT_CANAL_HEIGHT = Inches(3.5)
+
+# Encabezados fijos de la slide de canales
+PPT_HEADING_CALL = "📞 CANAL CALL"
+PPT_HEADING_VOICEBOT = "🤖 CANAL VOICEBOT"
+
+
+# Helpers de formato (cacheados por valor y tipo: 0 y 0.0 no comparten entrada)
+@lru_cache(maxsize=4096, typed=True)
+def _fmt_thousands(value: int) -> str:
+    """Formatear entero con separador de miles"""
+    return f"{value:,}"
+
+
+@lru_cache(maxsize=4096, typed=True)
+def _fmt_money(value: float) -> str:
+    """Formatear monto en dólares sin decimales (NaN se muestra como $nan)"""
+    return f"${value:,.0f}"
+
+
+@lru_cache(maxsize=4096, typed=True)
+def _fmt_pct(value: float) -> str:
+    """Formatear tasa ya expresada en porcentaje"""
+    return f"{value}%"
+
+
+@dataclass(frozen=True)
+class KpiRow:
+    """KPIs de una campaña (archivo), extraídos una sola vez desde el dict de entrada"""
+    # __slots__ declarado a mano: dataclass(slots=True) requiere Python 3.10+
+    __slots__ = (
+        'archivo', 'total_gestiones', 'clientes_gestionados', 'contactos_efectivos',
+        'pdps', 'monto_compromisos', 'tasa_contactabilidad', 'tasa_pdp'
+    )
+    archivo: str
+    total_gestiones: int
+    clientes_gestionados: int
+    contactos_efectivos: int
+    pdps: int
+    monto_compromisos: float
+    tasa_contactabilidad: float
+    tasa_pdp: float
+    
+    @classmethod
+    def from_dict(cls, kpi: Dict) -> 'KpiRow':
+        """Construir desde el dict generado por el procesamiento de campañas"""
+        return cls(
+            archivo=str(kpi.get('archivo', '')),
+            total_gestiones=kpi.get('total_gestiones', 0),
+            clientes_gestionados=kpi.get('clientes_gestionados', 0),
+            contactos_efectivos=kpi.get('contactos_efectivos', 0),
+            pdps=kpi.get('pdps', 0),
+            monto_compromisos=kpi.get('monto_compromisos', 0),
+            tasa_contactabilidad=kpi.get('tasa_contactabilidad', 0),
+            tasa_pdp=kpi.get('tasa_pdp', 0)
+        )
+
 class TelefonicaReportGenerator:
     """
     Generador de reportes semanales para Telefónica del Perú
@@ -58,6 +134,34 @@ class TelefonicaReportGenerator:
         'light_gray': 'F2F2F2'
     }
     
+    # Formatos Excel compartidos (se registran una sola vez por workbook)
+    XL_FORMATS = {
+        'title': {'bold': True, 'font_size': 14, 'font_color': f"#{COLORS['white']}",
+                  'bg_color': f"#{COLORS['telefonica_blue']}"},
+        'subtitle': {'bold': True, 'font_size': 12, 'font_color': f"#{COLORS['white']}",
+                     'bg_color': f"#{COLORS['telefonica_blue']}"},
+        'header': {'bold': True, 'font_color': f"#{COLORS['white']}", 'bg_color': f"#{COLORS['telefonica_light_blue']}"},
+        'header_green': {'bold': True, 'font_color': f"#{COLORS['white']}", 'bg_color': f"#{COLORS['telefonica_green']}"},
+        'header_orange': {'bold': True, 'font_color': f"#{COLORS['white']}", 'bg_color': f"#{COLORS['telefonica_orange']}"},
+        'estado_activa': {'font_color': f"#{COLORS['white']}", 'bg_color': f"#{COLORS['telefonica_green']}"},
+        'prioridad_alta': {'font_color': f"#{COLORS['white']}", 'bg_color': '#FF6B6B'},
+        'prioridad_media': {'bg_color': '#FFE66D'},
+        'integer': {'num_format': '#,##0'},
+        'money': {'num_format': '$#,##0'},
+        'money_2d': {'num_format': '$#,##0.00'},
+        'pct': {'num_format': '0.00"%"'},
+        'seconds': {'num_format': '0.0" seg"'}
+    }
+    
+    # Encabezados fijos de las hojas tabulares
+    XL_HEADERS_EVOLUCION = ('Fecha', 'CALL Gestiones', 'CALL Contactos', 'VOICEBOT Gestiones',
+                            'VOICEBOT Contactos', 'Total Gestiones', 'Total Contactos', 'Tasa Contactabilidad')
+    XL_HEADERS_CARTERAS = ('Archivo', 'Tipo Cartera', 'Fecha Asignación', 'Fecha Cierre',
+                           'Clientes Asignados', 'Cuentas', 'Días Vigencia', 'Estado')
+    XL_HEADERS_KPIS = ('Archivo', 'Total Gestiones', 'Clientes Gestionados', 'Contactos Efectivos',
+                       'PDPs', 'Monto Compromisos', 'Tasa Contactabilidad', 'Tasa PDP')
+    XL_HEADERS_RECOMENDACIONES = ('Categoría', 'Prioridad', 'Descripción', 'Acción Recomendada')
+    
     def __init__(self, fecha_inicio: str, fecha_fin: str):
         """
         Inicializar generador de reportes
@@ -162,10 +266,11 @@ class TelefonicaReportGenerator:
         
         # Métricas básicas
         total_gestiones = len(channel_data)
-        contactos_efectivos = len(channel_data[channel_data['contactabilidad'] == 'CONTACTO_EFECTIVO'])
-        contactos_no_efectivos = len(channel_data[channel_data['contactabilidad'] == 'CONTACTO_NO_EFECTIVO'])
-        no_contactos = len(channel_data[channel_data['contactabilidad'] == 'NO_CONTACTO'])
-        compromisos = len(channel_data[channel_data['es_pdp'] == 'SI'])
+        conteo_contactabilidad = channel_data['contactabilidad'].value_counts()
+        contactos_efectivos = int(conteo_contactabilidad.get('CONTACTO_EFECTIVO', 0))
+        contactos_no_efectivos = int(conteo_contactabilidad.get('CONTACTO_NO_EFECTIVO', 0))
+        no_contactos = int(conteo_contactabilidad.get('NO_CONTACTO', 0))
+        compromisos = int((channel_data['es_pdp'] == 'SI').sum())
         monto_compromisos = channel_data['monto_compromiso'].sum() if 'monto_compromiso' in channel_data.columns else 0
         clientes_unicos = channel_data['cod_luna'].nunique()
         
@@ -300,8 +405,8 @@ class TelefonicaReportGenerator:
             self.data['pagos'] = {'total_pagos': 0, 'clientes_con_pago': 0, 'monto_total': 0, 'ticket_promedio': 0, 'monto_min': 0, 'monto_max': 0}
     
     def _process_kpis_campania(self, kpis_campania: List[Dict]) -> None:
-        """Procesar KPIs por campaña"""
-        self.data['kpis_por_campania'] = kpis_campania or []
+        """Procesar KPIs por campaña (se convierten a KpiRow una sola vez)"""
+        self.data['kpis_por_campania'] = [KpiRow.from_dict(kpi) for kpi in kpis_campania or []]
     
     def _calculate_consolidated_metrics(self) -> None:
         """Calcular métricas consolidadas"""
@@ -366,7 +471,7 @@ class TelefonicaReportGenerator:
                 recomendaciones.append({
                     'categoria': 'Seguimiento Compromisos',
                     'prioridad': 'Alta',
-                    'descripcion': f'${monto_compromisos:,.0f} en compromisos requiere seguimiento intensivo',
+                    'descripcion': f'{_fmt_money(monto_compromisos)} en compromisos requiere seguimiento intensivo',
                     'accion': 'Implementar sistema de tracking de cumplimiento'
                 })
             
@@ -387,325 +492,261 @@ class TelefonicaReportGenerator:
         logger.info(f"📊 Generando reporte Excel: {output_path}")
         
         try:
-            # Crear workbook
-            wb = openpyxl.Workbook()
-            wb.remove(wb.active)  # Remover hoja por defecto
-            
-            # Generar hojas
-            self._create_excel_resumen_ejecutivo(wb)
-            self._create_excel_analisis_canales(wb)
-            self._create_excel_evolucion_diaria(wb)
-            self._create_excel_carteras_activas(wb)
-            if self.data['kpis_por_campania']:
-                self._create_excel_kpis_campanias(wb)
-            if self.data['recomendaciones']:
-                self._create_excel_recomendaciones(wb)
-            
-            # Guardar archivo
-            wb.save(output_path)
+            self._write_xlsxwriter(output_path)
             logger.info(f"✅ Reporte Excel generado exitosamente: {output_path}")
-            
+        
             return output_path
-            
+        
         except Exception as e:
             logger.error(f"❌ Error generando Excel: {str(e)}")
             raise
     
-    def _create_excel_resumen_ejecutivo(self, wb: openpyxl.Workbook) -> None:
+    def _write_xlsxwriter(self, output_path: str) -> None:
+        """
+        Escribir el workbook con XlsxWriter en modo constant_memory
+        
+        Las filas se vuelcan al archivo a medida que se escriben, por lo que
+        cada hoja debe escribirse en orden de fila. Los formatos se crean una
+        sola vez por workbook y se reutilizan en todas las hojas. Los NaN/INF
+        (p.ej. duración promedio sin datos) se escriben como error de Excel
+        en lugar de abortar el reporte.
+        """
+        wb = xlsxwriter.Workbook(output_path, {'constant_memory': True, 'nan_inf_to_errors': True})
+        try:
+            formats = {name: wb.add_format(spec) for name, spec in self.XL_FORMATS.items()}
+        
+            # Generar hojas
+            self._create_excel_resumen_ejecutivo(wb, formats)
+            self._create_excel_analisis_canales(wb, formats)
+            self._create_excel_evolucion_diaria(wb, formats)
+            self._create_excel_carteras_activas(wb, formats)
+            self._create_excel_kpis_campanias(wb, formats)
+            self._create_excel_recomendaciones(wb, formats)
+        finally:
+            # Guardar archivo
+            wb.close()
+    
+    def _create_excel_resumen_ejecutivo(self, wb: xlsxwriter.Workbook, formats: Dict) -> None:
         """Crear hoja de resumen ejecutivo"""
-        ws = wb.create_sheet("Resumen Ejecutivo")
+        ws = wb.add_worksheet("Resumen Ejecutivo")
+        
+        # Ajustar anchos
+        ws.set_column('A:A', 25)
+        ws.set_column('B:B', 20)
+        ws.set_column('C:C', 15)
+        ws.set_column('D:D', 40)
         
         # Título principal
-        ws['A1'] = "INFORME SEMANAL DE GESTIÓN DE COBRANZA"
-        ws['A2'] = f"Telefónica del Perú - Período: {self.periodo_str}"
-        ws['A3'] = f"Generado: {self.fecha_generacion.strftime('%d/%m/%Y %H:%M')}"
-        
-        # Formatear títulos
-        for row in range(1, 4):
-            cell = ws[f'A{row}']
-            cell.font = Font(bold=True, size=14 if row == 1 else 12, color=self.COLORS['white'])
-            cell.fill = PatternFill(start_color=self.COLORS['telefonica_blue'], 
-                                  end_color=self.COLORS['telefonica_blue'], fill_type="solid")
-            ws.merge_cells(f'A{row}:D{row}')
-        
-        # Datos principales
+        ws.merge_range('A1:D1', "INFORME SEMANAL DE GESTIÓN DE COBRANZA", formats['title'])
+        ws.merge_range('A2:D2', f"Telefónica del Perú - Período: {self.periodo_str}", formats['subtitle'])
+        ws.merge_range('A3:D3', f"Generado: {self.fecha_generacion.strftime('%d/%m/%Y %H:%M')}", formats['subtitle'])
+        
+        # Encabezados
+        ws.write_row(5, 0, ['INDICADOR CLAVE', 'VALOR', 'MÉTRICA', 'OBSERVACIONES'], formats['header'])
+        
+        # Datos principales: (indicador, valor, formato valor, métrica, formato métrica, observaciones)
         resumen = self.data['resumen_ejecutivo']
         data_rows = [
-            ['', '', '', ''],
-            ['INDICADOR CLAVE', 'VALOR', 'MÉTRICA', 'OBSERVACIONES'],
-            ['Total Gestiones', f"{resumen.get('total_gestiones', 0):,}", '100%', 'CALL + VOICEBOT'],
-            ['Contactos Efectivos', f"{resumen.get('total_contactos_efectivos', 0):,}", 
-             f"{resumen.get('tasa_contactabilidad_global', 0)}%", 'Tasa de contactabilidad global'],
-            ['Compromisos Obtenidos', f"{resumen.get('total_compromisos', 0):,}", 
-             f"{resumen.get('tasa_compromiso_global', 0)}%", 'De contactos efectivos'],
-            ['Monto Compromisos CALL', f"${resumen.get('monto_compromisos_call', 0):,.0f}", '-', 
-             f"Promedio: ${resumen.get('monto_compromisos_call', 0) / max(resumen.get('total_compromisos', 1), 1):.0f}"],
-            ['Clientes Únicos', f"{resumen.get('clientes_unicos_total', 0):,}", '-', 'Total gestionados'],
+            ('Total Gestiones', resumen.get('total_gestiones', 0), formats['integer'],
+             100, formats['pct'], 'CALL + VOICEBOT'),
+            ('Contactos Efectivos', resumen.get('total_contactos_efectivos', 0), formats['integer'],
+             resumen.get('tasa_contactabilidad_global', 0), formats['pct'], 'Tasa de contactabilidad global'),
+            ('Compromisos Obtenidos', resumen.get('total_compromisos', 0), formats['integer'],
+             resumen.get('tasa_compromiso_global', 0), formats['pct'], 'De contactos efectivos'),
+            ('Monto Compromisos CALL', resumen.get('monto_compromisos_call', 0), formats['money'], '-', None,
+             f"Promedio: ${resumen.get('monto_compromisos_call', 0) / max(resumen.get('total_compromisos', 1), 1):.0f}"),
+            ('Clientes Únicos', resumen.get('clientes_unicos_total', 0), formats['integer'], '-', None,
+             'Total gestionados'),
         ]
         
         # Agregar datos de pagos si están disponibles
         if 'pagos' in self.data and self.data['pagos']['total_pagos'] > 0:
             pagos = self.data['pagos']
             data_rows.extend([
-                ['Clientes con Pago', f"{pagos.get('clientes_con_pago', 0):,}", '-', 
-                 f"Total: ${pagos.get('monto_total', 0):,.0f}"],
-                ['Ticket Promedio Pago', f"${pagos.get('ticket_promedio', 0):.2f}", '-', 
-                 f"Rango: ${pagos.get('monto_min', 0):.2f} - ${pagos.get('monto_max', 0):,.0f}"]
+                ('Clientes con Pago', pagos.get('clientes_con_pago', 0), formats['integer'], '-', None,
+                 f"Total: {_fmt_money(pagos.get('monto_total', 0))}"),
+                ('Ticket Promedio Pago', pagos.get('ticket_promedio', 0), formats['money_2d'], '-', None,
+                 f"Rango: ${pagos.get('monto_min', 0):.2f} - {_fmt_money(pagos.get('monto_max', 0))}")
             ])
         
         # Escribir datos
-        for i, row_data in enumerate(data_rows, start=5):
-            for j, value in enumerate(row_data, start=1):
-                cell = ws.cell(row=i, column=j, value=value)
-                if i == 6:  # Encabezados
-                    cell.font = Font(bold=True, color=self.COLORS['white'])
-                    cell.fill = PatternFill(start_color=self.COLORS['telefonica_light_blue'], 
-                                          end_color=self.COLORS['telefonica_light_blue'], fill_type="solid")
-        
-        # Ajustar anchos
-        ws.column_dimensions['A'].width = 25
-        ws.column_dimensions['B'].width = 20
-        ws.column_dimensions['C'].width = 15
-        ws.column_dimensions['D'].width = 40
+        for row, (indicador, valor, valor_fmt, metrica, metrica_fmt, observacion) in enumerate(data_rows, start=6):
+            ws.write(row, 0, indicador)
+            ws.write(row, 1, valor, valor_fmt)
+            ws.write(row, 2, metrica, metrica_fmt)
+            ws.write(row, 3, observacion)
     
-    def _create_excel_analisis_canales(self, wb: openpyxl.Workbook) -> None:
+    def _create_excel_analisis_canales(self, wb: xlsxwriter.Workbook, formats: Dict) -> None:
         """Crear hoja de análisis por canales"""
-        ws = wb.create_sheet("Análisis por Canal")
+        ws = wb.add_worksheet("Análisis por Canal")
+        
+        # Ajustar anchos
+        ws.set_column('A:A', 25)
+        ws.set_column('B:B', 20)
+        ws.set_column('C:C', 15)
         
         # Título
-        ws['A1'] = "ANÁLISIS DETALLADO POR CANAL"
-        ws['A1'].font = Font(bold=True, size=14, color=self.COLORS['white'])
-        ws['A1'].fill = PatternFill(start_color=self.COLORS['telefonica_blue'], 
-                                   end_color=self.COLORS['telefonica_blue'], fill_type="solid")
-        ws.merge_cells('A1:C1')
+        ws.merge_range('A1:C1', "ANÁLISIS DETALLADO POR CANAL", formats['title'])
         
-        # Canal CALL
+        # Canal CALL: (indicador, valor, formato valor, porcentaje)
         call_data = self.data['canal_call']
         call_rows = [
-            ['', '', ''],
-            ['CANAL CALL', 'VALOR', 'PORCENTAJE'],
-            ['Gestiones Totales', f"{call_data.get('total_gestiones', 0):,}", '-'],
-            ['Contactos Efectivos', f"{call_data.get('contactos_efectivos', 0):,}", 
-             f"{call_data.get('tasa_contactabilidad', 0)}%"],
-            ['Contactos No Efectivos', f"{call_data.get('contactos_no_efectivos', 0):,}", '-'],
-            ['No Contactos', f"{call_data.get('no_contactos', 0):,}", '-'],
-            ['Compromisos', f"{call_data.get('compromisos', 0):,}", 
-             f"{call_data.get('tasa_compromiso', 0)}%"],
-            ['Monto Compromisos', f"${call_data.get('monto_compromisos', 0):,.0f}", '-'],
-            ['Duración Promedio', f"{call_data.get('duracion_promedio', 0):.1f} seg", '-']
+            ('Gestiones Totales', call_data.get('total_gestiones', 0), formats['integer'], '-'),
+            ('Contactos Efectivos', call_data.get('contactos_efectivos', 0), formats['integer'],
+             call_data.get('tasa_contactabilidad', 0)),
+            ('Contactos No Efectivos', call_data.get('contactos_no_efectivos', 0), formats['integer'], '-'),
+            ('No Contactos', call_data.get('no_contactos', 0), formats['integer'], '-'),
+            ('Compromisos', call_data.get('compromisos', 0), formats['integer'],
+             call_data.get('tasa_compromiso', 0)),
+            ('Monto Compromisos', call_data.get('monto_compromisos', 0), formats['money'], '-'),
+            ('Duración Promedio', call_data.get('duracion_promedio', 0), formats['seconds'], '-')
         ]
         
         # Escribir datos CALL
-        for i, row_data in enumerate(call_rows, start=3):
-            for j, value in enumerate(row_data, start=1):
-                cell = ws.cell(row=i, column=j, value=value)
-                if i == 4:  # Encabezado
-                    cell.font = Font(bold=True, color=self.COLORS['white'])
-                    cell.fill = PatternFill(start_color=self.COLORS['telefonica_green'], 
-                                          end_color=self.COLORS['telefonica_green'], fill_type="solid")
+        ws.write_row(3, 0, ['CANAL CALL', 'VALOR', 'PORCENTAJE'], formats['header_green'])
+        next_row = self._write_channel_rows(ws, 4, call_rows, formats)
         
         # Canal VOICEBOT
         voicebot_data = self.data['canal_voicebot']
         voicebot_rows = [
-            ['', '', ''],
-            ['CANAL VOICEBOT', 'VALOR', 'PORCENTAJE'],
-            ['Gestiones Totales', f"{voicebot_data.get('total_gestiones', 0):,}", '-'],
-            ['Contactos Efectivos', f"{voicebot_data.get('contactos_efectivos', 0):,}", 
-             f"{voicebot_data.get('tasa_contactabilidad', 0)}%"],
-            ['Compromisos', f"{voicebot_data.get('compromisos', 0):,}", 
-             f"{voicebot_data.get('tasa_compromiso', 0)}%"],
+            ('Gestiones Totales', voicebot_data.get('total_gestiones', 0), formats['integer'], '-'),
+            ('Contactos Efectivos', voicebot_data.get('contactos_efectivos', 0), formats['integer'],
+             voicebot_data.get('tasa_contactabilidad', 0)),
+            ('Compromisos', voicebot_data.get('compromisos', 0), formats['integer'],
+             voicebot_data.get('tasa_compromiso', 0)),
         ]
         
         # Escribir datos VOICEBOT
-        start_row = len(call_rows) + 5
-        for i, row_data in enumerate(voicebot_rows, start=start_row):
-            for j, value in enumerate(row_data, start=1):
-                cell = ws.cell(row=i, column=j, value=value)
-                if i == start_row + 1:  # Encabezado
-                    cell.font = Font(bold=True, color=self.COLORS['white'])
-                    cell.fill = PatternFill(start_color=self.COLORS['telefonica_orange'], 
-                                          end_color=self.COLORS['telefonica_orange'], fill_type="solid")
-        
-        # Ajustar anchos
-        ws.column_dimensions['A'].width = 25
-        ws.column_dimensions['B'].width = 20
-        ws.column_dimensions['C'].width = 15
+        start_row = next_row + 3
+        ws.write_row(start_row, 0, ['CANAL VOICEBOT', 'VALOR', 'PORCENTAJE'], formats['header_orange'])
+        self._write_channel_rows(ws, start_row + 1, voicebot_rows, formats)
+    
+    def _write_channel_rows(self, ws, start_row: int, rows: List[Tuple], formats: Dict) -> int:
+        """Escribir filas de métricas de canal y retornar la siguiente fila libre"""
+        for row, (indicador, valor, valor_fmt, porcentaje) in enumerate(rows, start=start_row):
+            ws.write(row, 0, indicador)
+            ws.write(row, 1, valor, valor_fmt)
+            ws.write(row, 2, porcentaje, None if porcentaje == '-' else formats['pct'])
+        return start_row + len(rows)
     
-    def _create_excel_evolucion_diaria(self, wb: openpyxl.Workbook) -> None:
+    def _create_excel_evolucion_diaria(self, wb: xlsxwriter.Workbook, formats: Dict) -> None:
         """Crear hoja de evolución diaria"""
-        ws = wb.create_sheet("Evolución Diaria")
+        ws = wb.add_worksheet("Evolución Diaria")
+        
+        # Ajustar anchos
+        ws.set_column('A:H', 15)
         
         # Título
-        ws['A1'] = "EVOLUCIÓN DIARIA - CONTACTOS EFECTIVOS"
-        ws['A1'].font = Font(bold=True, size=14, color=self.COLORS['white'])
-        ws['A1'].fill = PatternFill(start_color=self.COLORS['telefonica_blue'], 
-                                   end_color=self.COLORS['telefonica_blue'], fill_type="solid")
-        ws.merge_cells('A1:H1')
+        ws.merge_range('A1:H1', "EVOLUCIÓN DIARIA - CONTACTOS EFECTIVOS", formats['title'])
         
         # Encabezados
-        headers = ['Fecha', 'CALL Gestiones', 'CALL Contactos', 'VOICEBOT Gestiones', 
-                  'VOICEBOT Contactos', 'Total Gestiones', 'Total Contactos', 'Tasa Contactabilidad']
-        
-        for j, header in enumerate(headers, start=1):
-            cell = ws.cell(row=3, column=j, value=header)
-            cell.font = Font(bold=True, color=self.COLORS['white'])
-            cell.fill = PatternFill(start_color=self.COLORS['telefonica_light_blue'], 
-                                   end_color=self.COLORS['telefonica_light_blue'], fill_type="solid")
+        ws.write_row(2, 0, self.XL_HEADERS_EVOLUCION, formats['header'])
+        ws.freeze_panes(3, 0)
         
         # Datos diarios
-        for i, dia in enumerate(self.data['evolucion_diaria'], start=4):
-            row_data = [
+        for row, dia in enumerate(self.data['evolucion_diaria'], start=3):
+            ws.write_row(row, 0, [
                 dia['fecha'],
                 dia['call_gestiones'],
                 dia['call_contactos'],
                 dia['voicebot_gestiones'],
                 dia['voicebot_contactos'],
                 dia['total_gestiones'],
-                dia['total_contactos'],
-                f"{dia['tasa_contactabilidad']}%"
-            ]
-            
-            for j, value in enumerate(row_data, start=1):
-                ws.cell(row=i, column=j, value=value)
-        
-        # Ajustar anchos
-        for col in ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H']:
-            ws.column_dimensions[col].width = 15
+                dia['total_contactos']
+            ])
+            ws.write_number(row, 7, dia['tasa_contactabilidad'], formats['pct'])
     
-    def _create_excel_carteras_activas(self, wb: openpyxl.Workbook) -> None:
+    def _create_excel_carteras_activas(self, wb: xlsxwriter.Workbook, formats: Dict) -> None:
         """Crear hoja de carteras activas"""
-        ws = wb.create_sheet("Carteras Activas")
+        ws = wb.add_worksheet("Carteras Activas")
+        
+        # Ajustar anchos
+        ws.set_column('A:A', 30)
+        ws.set_column('B:H', 15)
         
         # Título
-        ws['A1'] = "CARTERAS ACTIVAS - PERÍODO ANALIZADO"
-        ws['A1'].font = Font(bold=True, size=14, color=self.COLORS['white'])
-        ws['A1'].fill = PatternFill(start_color=self.COLORS['telefonica_blue'], 
-                                   end_color=self.COLORS['telefonica_blue'], fill_type="solid")
-        ws.merge_cells('A1:H1')
+        ws.merge_range('A1:H1', "CARTERAS ACTIVAS - PERÍODO ANALIZADO", formats['title'])
         
         # Encabezados
-        headers = ['Archivo', 'Tipo Cartera', 'Fecha Asignación', 'Fecha Cierre', 
-                  'Clientes Asignados', 'Cuentas', 'Días Vigencia', 'Estado']
-        
-        for j, header in enumerate(headers, start=1):
-            cell = ws.cell(row=3, column=j, value=header)
-            cell.font = Font(bold=True, color=self.COLORS['white'])
-            cell.fill = PatternFill(start_color=self.COLORS['telefonica_light_blue'], 
-                                   end_color=self.COLORS['telefonica_light_blue'], fill_type="solid")
+        ws.write_row(2, 0, self.XL_HEADERS_CARTERAS, formats['header'])
+        ws.freeze_panes(3, 0)
         
         # Datos de carteras
-        for i, cartera in enumerate(self.data['carteras_activas'], start=4):
-            row_data = [
+        for row, cartera in enumerate(self.data['carteras_activas'], start=3):
+            ws.write_row(row, 0, [
                 cartera['archivo'],
                 cartera['tipo_cartera'],
                 cartera['fecha_asignacion'],
                 cartera['fecha_cierre'],
                 cartera.get('clientes_asignados', 0),
                 cartera.get('cuentas_asignadas', 0),
-                cartera['dias_vigencia'],
-                cartera['estado']
-            ]
-            
-            for j, value in enumerate(row_data, start=1):
-                cell = ws.cell(row=i, column=j, value=value)
-                # Colorear estado
-                if j == 8:  # Columna Estado
-                    if value == 'ACTIVA':
-                        cell.fill = PatternFill(start_color=self.COLORS['telefonica_green'], 
-                                              end_color=self.COLORS['telefonica_green'], fill_type="solid")
-                        cell.font = Font(color=self.COLORS['white'])
+                cartera['dias_vigencia']
+            ])
+            # Colorear estado
+            estado = cartera['estado']
+            ws.write(row, 7, estado, formats['estado_activa'] if estado == 'ACTIVA' else None)
+    
+    def _create_excel_kpis_campanias(self, wb: xlsxwriter.Workbook, formats: Dict) -> None:
+        """Crear hoja de KPIs por campaña (se omite si no hay KPIs)"""
+        if not self.data.get('kpis_por_campania'):
+            return
+        
+        ws = wb.add_worksheet("KPIs por Campaña")
         
         # Ajustar anchos
-        ws.column_dimensions['A'].width = 30
-        for col in ['B', 'C', 'D', 'E', 'F', 'G', 'H']:
-            ws.column_dimensions[col].width = 15
-    
-    def _create_excel_kpis_campanias(self, wb: openpyxl.Workbook) -> None:
-        """Crear hoja de KPIs por campaña"""
-        ws = wb.create_sheet("KPIs por Campaña")
+        ws.set_column('A:A', 30)
+        ws.set_column('B:H', 15)
         
         # Título
-        ws['A1'] = "KPIS DETALLADOS POR CAMPAÑA"
-        ws['A1'].font = Font(bold=True, size=14, color=self.COLORS['white'])
-        ws['A1'].fill = PatternFill(start_color=self.COLORS['telefonica_blue'], 
-                                   end_color=self.COLORS['telefonica_blue'], fill_type="solid")
-        ws.merge_cells('A1:H1')
+        ws.merge_range('A1:H1', "KPIS DETALLADOS POR CAMPAÑA", formats['title'])
         
         # Encabezados
-        headers = ['Archivo', 'Total Gestiones', 'Clientes Gestionados', 'Contactos Efectivos', 
-                  'PDPs', 'Monto Compromisos', 'Tasa Contactabilidad', 'Tasa PDP']
-        
-        for j, header in enumerate(headers, start=1):
-            cell = ws.cell(row=3, column=j, value=header)
-            cell.font = Font(bold=True, color=self.COLORS['white'])
-            cell.fill = PatternFill(start_color=self.COLORS['telefonica_light_blue'], 
-                                   end_color=self.COLORS['telefonica_light_blue'], fill_type="solid")
+        ws.write_row(2, 0, self.XL_HEADERS_KPIS, formats['header'])
+        ws.freeze_panes(3, 0)
         
         # Datos de KPIs
-        for i, kpi in enumerate(self.data['kpis_por_campania'], start=4):
-            row_data = [
-                kpi.get('archivo', ''),
-                kpi.get('total_gestiones', 0),
-                kpi.get('clientes_gestionados', 0),
-                kpi.get('contactos_efectivos', 0),
-                kpi.get('pdps', 0),
-                f"${kpi.get('monto_compromisos', 0):,.0f}",
-                f"{kpi.get('tasa_contactabilidad', 0)}%",
-                f"{kpi.get('tasa_pdp', 0)}%"
-            ]
-            
-            for j, value in enumerate(row_data, start=1):
-                ws.cell(row=i, column=j, value=value)
+        # (escritura tipada: evita que xlsxwriter infiera el tipo celda por celda)
+        for row, kpi in enumerate(self.data['kpis_por_campania'], start=3):
+            ws.write_string(row, 0, kpi.archivo)
+            ws.write_number(row, 1, kpi.total_gestiones)
+            ws.write_number(row, 2, kpi.clientes_gestionados)
+            ws.write_number(row, 3, kpi.contactos_efectivos)
+            ws.write_number(row, 4, kpi.pdps)
+            ws.write_number(row, 5, kpi.monto_compromisos, formats['money'])
+            ws.write_number(row, 6, kpi.tasa_contactabilidad, formats['pct'])
+            ws.write_number(row, 7, kpi.tasa_pdp, formats['pct'])
+    
+    def _create_excel_recomendaciones(self, wb: xlsxwriter.Workbook, formats: Dict) -> None:
+        """Crear hoja de recomendaciones (se omite si no hay recomendaciones)"""
+        if not self.data.get('recomendaciones'):
+            return
+        
+        ws = wb.add_worksheet("Recomendaciones")
         
         # Ajustar anchos
-        ws.column_dimensions['A'].width = 30
-        for col in ['B', 'C', 'D', 'E', 'F', 'G', 'H']:
-            ws.column_dimensions[col].width = 15
-    
-    def _create_excel_recomendaciones(self, wb: openpyxl.Workbook) -> None:
-        """Crear hoja de recomendaciones"""
-        ws = wb.create_sheet("Recomendaciones")
+        ws.set_column('A:A', 20)
+        ws.set_column('B:B', 12)
+        ws.set_column('C:C', 40)
+        ws.set_column('D:D', 50)
         
         # Título
-        ws['A1'] = "RECOMENDACIONES ESTRATÉGICAS"
-        ws['A1'].font = Font(bold=True, size=14, color=self.COLORS['white'])
-        ws['A1'].fill = PatternFill(start_color=self.COLORS['telefonica_blue'], 
-                                   end_color=self.COLORS['telefonica_blue'], fill_type="solid")
-        ws.merge_cells('A1:D1')
+        ws.merge_range('A1:D1', "RECOMENDACIONES ESTRATÉGICAS", formats['title'])
         
         # Encabezados
-        headers = ['Categoría', 'Prioridad', 'Descripción', 'Acción Recomendada']
+        ws.write_row(2, 0, self.XL_HEADERS_RECOMENDACIONES, formats['header'])
+        ws.freeze_panes(3, 0)
         
-        for j, header in enumerate(headers, start=1):
-            cell = ws.cell(row=3, column=j, value=header)
-            cell.font = Font(bold=True, color=self.COLORS['white'])
-            cell.fill = PatternFill(start_color=self.COLORS['telefonica_light_blue'], 
-                                   end_color=self.COLORS['telefonica_light_blue'], fill_type="solid")
+        # Formatos por prioridad (resueltos una sola vez para toda la hoja)
+        prioridad_formats = {'Alta': formats['prioridad_alta'], 'Media': formats['prioridad_media']}
         
         # Datos de recomendaciones
-        for i, rec in enumerate(self.data['recomendaciones'], start=4):
-            row_data = [
-                rec.get('categoria', ''),
-                rec.get('prioridad', ''),
-                rec.get('descripcion', ''),
-                rec.get('accion', '')
-            ]
-            
-            for j, value in enumerate(row_data, start=1):
-                cell = ws.cell(row=i, column=j, value=value)
-                # Colorear por prioridad
-                if j == 2:  # Columna Prioridad
-                    if value == 'Alta':
-                        cell.fill = PatternFill(start_color='FF6B6B', end_color='FF6B6B', fill_type="solid")
-                        cell.font = Font(color=self.COLORS['white'])
-                    elif value == 'Media':
-                        cell.fill = PatternFill(start_color='FFE66D', end_color='FFE66D', fill_type="solid")
-        
-        # Ajustar anchos
-        ws.column_dimensions['A'].width = 20
-        ws.column_dimensions['B'].width = 12
-        ws.column_dimensions['C'].width = 40
-        ws.column_dimensions['D'].width = 50
+        for row, rec in enumerate(self.data['recomendaciones'], start=3):
+            prioridad = rec.get('prioridad', '')
+            ws.write_string(row, 0, rec.get('categoria', ''))
+            # Colorear por prioridad
+            ws.write_string(row, 1, prioridad, prioridad_formats.get(prioridad))
+            ws.write_string(row, 2, rec.get('descripcion', ''))
+            ws.write_string(row, 3, rec.get('accion', ''))
     
     def generate_powerpoint_report(self, output_path: str = None) -> str:
         """
@@ -718,8 +759,8 @@ class TelefonicaReportGenerator:
         logger.info(f"📈 Generando presentación PowerPoint: {output_path}")
         
         try:
-            # Crear presentación
-            prs = Presentation()
+            # Crear presentación desde la plantilla cacheada
+            prs = Presentation(io.BytesIO(self._ppt_template_bytes()))
             
             # Generar slides
             self._create_ppt_portada(prs)
@@ -739,6 +780,36 @@ class TelefonicaReportGenerator:
             logger.error(f"❌ Error generando PowerPoint: {str(e)}")
             raise
     
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _ppt_template_bytes() -> bytes:
+        """
+        Plantilla PowerPoint serializada (se lee una sola vez por proceso)
+        
+        Evita volver a abrir el template por defecto de python-pptx desde disco
+        en cada reporte generado por la API.
+        """
+        buffer = io.BytesIO()
+        Presentation().save(buffer)
+        return buffer.getvalue()
+    
+    def _fill_bullets(self, tf, bullets: List[str], size: Pt) -> None:
+        """
+        Agregar viñetas a un text frame en un solo bloque XML
+        
+        Equivale a tf.add_paragraph() + p.text + p.font.size por viñeta, pero
+        arma todos los <a:p> en una cadena y los parsea una sola vez.
+        """
+        if not bullets:
+            return
+        
+        paragraphs = ''.join(
+            f'<a:p><a:pPr><a:defRPr sz="{size.centipoints}"/></a:pPr><a:r><a:t>{escape(text)}</a:t></a:r></a:p>'
+            for text in bullets
+        )
+        tx_body = parse_xml(f'<a:txBody {nsdecls("a")}>{paragraphs}</a:txBody>')
+        tf._txBody.extend(list(tx_body))
+    
     def _create_ppt_portada(self, prs: Presentation) -> None:
         """Crear slide de portada"""
         slide = prs.slides.add_slide(prs.slide_layouts[0])  # Title slide
@@ -747,11 +818,12 @@ class TelefonicaReportGenerator:
         subtitle = slide.placeholders[1]
         
         title.text = "INFORME SEMANAL DE GESTIÓN"
-        title.text_frame.paragraphs[0].font.size = Pt(32)
-        title.text_frame.paragraphs[0].font.bold = True
+        font = title.text_frame.paragraphs[0].font
+        font.size = PPT_SIZE_PORTADA
+        font.bold = True
         
         subtitle.text = f"Telefónica del Perú\\n{self.periodo_str}\\nSistema de Cobranza Automatizado"
-        subtitle.text_frame.paragraphs[0].font.size = Pt(18)
+        subtitle.text_frame.paragraphs[0].font.size = PPT_SIZE_SUBTITULO
     
     def _create_ppt_resumen_ejecutivo(self, prs: Presentation) -> None:
         """Crear slide de resumen ejecutivo"""
@@ -764,87 +836,76 @@ class TelefonicaReportGenerator:
         
         resumen = self.data['resumen_ejecutivo']
         tf = content.text_frame
-        tf.text = f"• {resumen.get('total_gestiones', 0):,} gestiones totales realizadas"
+        tf.text = f"• {_fmt_thousands(resumen.get('total_gestiones', 0))} gestiones totales realizadas"
         
         # Agregar párrafos adicionales
         paragraphs_data = [
-            f"• {resumen.get('total_contactos_efectivos', 0):,} contactos efectivos ({resumen.get('tasa_contactabilidad_global', 0)}%)",
-            f"• {resumen.get('total_compromisos', 0):,} compromisos obtenidos ({resumen.get('tasa_compromiso_global', 0)}%)",
-            f"• ${resumen.get('monto_compromisos_call', 0):,.0f} en compromisos CALL",
-            f"• {resumen.get('clientes_unicos_total', 0):,} clientes únicos gestionados"
+            f"• {_fmt_thousands(resumen.get('total_contactos_efectivos', 0))} contactos efectivos ({_fmt_pct(resumen.get('tasa_contactabilidad_global', 0))})",
+            f"• {_fmt_thousands(resumen.get('total_compromisos', 0))} compromisos obtenidos ({_fmt_pct(resumen.get('tasa_compromiso_global', 0))})",
+            f"• {_fmt_money(resumen.get('monto_compromisos_call', 0))} en compromisos CALL",
+            f"• {_fmt_thousands(resumen.get('clientes_unicos_total', 0))} clientes únicos gestionados"
         ]
         
         # Agregar información de pagos si disponible
         if 'pagos' in self.data and self.data['pagos']['total_pagos'] > 0:
             pagos = self.data['pagos']
-            paragraphs_data.append(f"• ${pagos.get('monto_total', 0):,.0f} en pagos procesados")
+            paragraphs_data.append(f"• {_fmt_money(pagos.get('monto_total', 0))} en pagos procesados")
         
-        for para_text in paragraphs_data:
-            p = tf.add_paragraph()
-            p.text = para_text
-            p.font.size = Pt(16)
+        self._fill_bullets(tf, paragraphs_data, PPT_SIZE_TEXTO)
     
     def _create_ppt_analisis_canales(self, prs: Presentation) -> None:
         """Crear slide de análisis por canales"""
         slide = prs.slides.add_slide(prs.slide_layouts[6])  # Blank
         
         # Título
-        left = Inches(0.5)
-        top = Inches(0.5)
-        width = Inches(9)
-        height = Inches(1)
-        title_box = slide.shapes.add_textbox(left, top, width, height)
+        title_box = slide.shapes.add_textbox(PPT_MARGEN_IZQ, PPT_TITULO_TOP, PPT_TITULO_WIDTH, PPT_TITULO_HEIGHT)
         tf = title_box.text_frame
         tf.text = "ANÁLISIS POR CANAL"
-        tf.paragraphs[0].font.size = Pt(28)
-        tf.paragraphs[0].font.bold = True
+        font = tf.paragraphs[0].font
+        font.size = PPT_SIZE_TITULO
+        font.bold = True
+        
+        # Sin gestiones en ningún canal: no armar los bloques por canal
+        if not (self.data['canal_call'].get('total_gestiones') or self.data['canal_voicebot'].get('total_gestiones')):
+            empty_box = slide.shapes.add_textbox(PPT_MARGEN_IZQ, PPT_CANAL_TOP, PPT_TITULO_WIDTH, PPT_TITULO_HEIGHT)
+            empty_box.text_frame.text = "• Sin gestiones registradas en el período"
+            empty_box.text_frame.paragraphs[0].font.size = PPT_SIZE_TEXTO
+            return
         
         # Canal CALL
         call_data = self.data['canal_call']
-        left = Inches(0.5)
-        top = Inches(2)
-        width = Inches(4)
-        height = Inches(3.5)
-        call_box = slide.shapes.add_textbox(left, top, width, height)
+        call_box = slide.shapes.add_textbox(PPT_MARGEN_IZQ, PPT_CANAL_TOP, PPT_CANAL_WIDTH, PPT_CANAL_HEIGHT)
         tf_call = call_box.text_frame
-        tf_call.text = "📞 CANAL CALL"
-        tf_call.paragraphs[0].font.size = Pt(20)
-        tf_call.paragraphs[0].font.bold = True
+        tf_call.text = PPT_HEADING_CALL
+        font = tf_call.paragraphs[0].font
+        font.size = PPT_SIZE_SECCION
+        font.bold = True
         
         call_bullets = [
-            f"• {call_data.get('total_gestiones', 0):,} gestiones",
-            f"• {call_data.get('tasa_contactabilidad', 0)}% contactabilidad",
-            f"• {call_data.get('compromisos', 0):,} compromisos",
-            f"• ${call_data.get('monto_compromisos', 0):,.0f} monto"
+            f"• {_fmt_thousands(call_data.get('total_gestiones', 0))} gestiones",
+            f"• {_fmt_pct(call_data.get('tasa_contactabilidad', 0))} contactabilidad",
+            f"• {_fmt_thousands(call_data.get('compromisos', 0))} compromisos",
+            f"• {_fmt_money(call_data.get('monto_compromisos', 0))} monto"
         ]
         
-        for bullet in call_bullets:
-            p = tf_call.add_paragraph()
-            p.text = bullet
-            p.font.size = Pt(14)
+        self._fill_bullets(tf_call, call_bullets, PPT_SIZE_DETALLE)
         
         # Canal VOICEBOT
         voicebot_data = self.data['canal_voicebot']
-        left = Inches(5)
-        top = Inches(2)
-        width = Inches(4)
-        height = Inches(3.5)
-        vb_box = slide.shapes.add_textbox(left, top, width, height)
+        vb_box = slide.shapes.add_textbox(PPT_CANAL_VB_LEFT, PPT_CANAL_TOP, PPT_CANAL_WIDTH, PPT_CANAL_HEIGHT)
         tf_vb = vb_box.text_frame
-        tf_vb.text = "🤖 CANAL VOICEBOT"
-        tf_vb.paragraphs[0].font.size = Pt(20)
-        tf_vb.paragraphs[0].font.bold = True
+        tf_vb.text = PPT_HEADING_VOICEBOT
+        font = tf_vb.paragraphs[0].font
+        font.size = PPT_SIZE_SECCION
+        font.bold = True
         
         vb_bullets = [
-            f"• {voicebot_data.get('total_gestiones', 0):,} gestiones",
-            f"• {voicebot_data.get('tasa_contactabilidad', 0)}% contactabilidad",
-            f"• {voicebot_data.get('compromisos', 0):,} compromisos"
+            f"• {_fmt_thousands(voicebot_data.get('total_gestiones', 0))} gestiones",
+            f"• {_fmt_pct(voicebot_data.get('tasa_contactabilidad', 0))} contactabilidad",
+            f"• {_fmt_thousands(voicebot_data.get('compromisos', 0))} compromisos"
         ]
         
-        for bullet in vb_bullets:
-            p = tf_vb.add_paragraph()
-            p.text = bullet
-            p.font.size = Pt(14)
+        self._fill_bullets(tf_vb, vb_bullets, PPT_SIZE_DETALLE)
     
     def _create_ppt_evolucion_temporal(self, prs: Presentation) -> None:
         """Crear slide de evolución temporal"""
@@ -857,25 +918,28 @@ class TelefonicaReportGenerator:
         
         tf = content.text_frame
         tf.text = "Tendencias de Contactabilidad por Día:"
-        tf.paragraphs[0].font.size = Pt(18)
-        tf.paragraphs[0].font.bold = True
-        
-        # Encontrar mejor y peor día
-        if self.data['evolucion_diaria']:
-            mejor_dia = max(self.data['evolucion_diaria'], key=lambda x: x['tasa_contactabilidad'])
-            peor_dia = min(self.data['evolucion_diaria'], key=lambda x: x['tasa_contactabilidad'])
-            
-            insights = [
-                f"• Mejor día: {mejor_dia['fecha']} ({mejor_dia['tasa_contactabilidad']}% contactabilidad)",
-                f"• Menor día: {peor_dia['fecha']} ({peor_dia['tasa_contactabilidad']}% contactabilidad)",
-                f"• Total días analizados: {len(self.data['evolucion_diaria'])}",
-                f"• Promedio contactabilidad: {sum(d['tasa_contactabilidad'] for d in self.data['evolucion_diaria']) / len(self.data['evolucion_diaria']):.1f}%"
-            ]
-            
-            for insight in insights:
-                p = tf.add_paragraph()
-                p.text = insight
-                p.font.size = Pt(14)
+        font = tf.paragraphs[0].font
+        font.size = PPT_SIZE_SUBTITULO
+        font.bold = True
+        
+        diaria = self.data['evolucion_diaria']
+        if not diaria:
+            self._fill_bullets(tf, ["• Sin datos de evolución diaria en el período"], PPT_SIZE_DETALLE)
+            return
+        
+        # Encontrar mejor y peor día (una sola extracción de tasas; argmax/argmin/mean sobre el array)
+        tasas = np.fromiter((d['tasa_contactabilidad'] for d in diaria), dtype=np.float64, count=len(diaria))
+        mejor_dia = diaria[int(tasas.argmax())]
+        peor_dia = diaria[int(tasas.argmin())]
+        
+        insights = [
+            f"• Mejor día: {mejor_dia['fecha']} ({_fmt_pct(mejor_dia['tasa_contactabilidad'])} contactabilidad)",
+            f"• Menor día: {peor_dia['fecha']} ({_fmt_pct(peor_dia['tasa_contactabilidad'])} contactabilidad)",
+            f"• Total días analizados: {len(diaria)}",
+            f"• Promedio contactabilidad: {tasas.mean():.1f}%"
+        ]
+        
+        self._fill_bullets(tf, insights, PPT_SIZE_DETALLE)
     
     def _create_ppt_carteras_activas(self, prs: Presentation) -> None:
         """Crear slide de carteras activas"""
@@ -886,31 +950,27 @@ class TelefonicaReportGenerator:
         
         title.text = "CARTERAS ACTIVAS"
         
-        tf = content.text_frame
-        total_clientes = sum(c.get('clientes_asignados', 0) for c in self.data['carteras_activas'])
-        tf.text = f"• {total_clientes:,} clientes asignados total"
-        tf.paragraphs[0].font.size = Pt(16)
-        
-        # Resumen por tipo de cartera
-        cartera_summary = {}
-        for cartera in self.data['carteras_activas']:
-            tipo = cartera['tipo_cartera']
+        # Resumen por tipo de cartera, total de clientes y vigencias en una sola pasada
+        cartera_summary = defaultdict(int)
+        total_clientes = 0
+        activas = 0
+        carteras = self.data['carteras_activas']
+        for cartera in carteras:
             clientes = cartera.get('clientes_asignados', 0)
-            if tipo in cartera_summary:
-                cartera_summary[tipo] += clientes
-            else:
-                cartera_summary[tipo] = clientes
+            cartera_summary[cartera['tipo_cartera']] += clientes
+            total_clientes += clientes
+            activas += cartera['estado'] == 'ACTIVA'
+        total_carteras = len(carteras)
+        
+        tf = content.text_frame
+        tf.text = f"• {_fmt_thousands(total_clientes)} clientes asignados total"
+        tf.paragraphs[0].font.size = PPT_SIZE_TEXTO
         
-        for tipo, clientes in cartera_summary.items():
-            p = tf.add_paragraph()
-            p.text = f"• {tipo}: {clientes:,} clientes"
-            p.font.size = Pt(14)
+        bullets = [f"• {tipo}: {_fmt_thousands(clientes)} clientes" for tipo, clientes in cartera_summary.items()]
         
         # Información de vigencias
-        activas = len([c for c in self.data['carteras_activas'] if c['estado'] == 'ACTIVA'])
-        p = tf.add_paragraph()
-        p.text = f"• {activas} carteras activas de {len(self.data['carteras_activas'])} total"
-        p.font.size = Pt(14)
+        bullets.append(f"• {activas} carteras activas de {total_carteras} total")
+        self._fill_bullets(tf, bullets, PPT_SIZE_DETALLE)
     
     def _create_ppt_recomendaciones(self, prs: Presentation) -> None:
         """Crear slide de recomendaciones"""
@@ -925,7 +985,7 @@ class TelefonicaReportGenerator:
         
         if not self.data['recomendaciones']:
             tf.text = "• Mantener monitoreo continuo de KPIs"
-            tf.paragraphs[0].font.size = Pt(16)
+            tf.paragraphs[0].font.size = PPT_SIZE_TEXTO
             
             general_recs = [
                 "• Optimizar distribución de cartera entre canales",
@@ -933,22 +993,15 @@ class TelefonicaReportGenerator:
                 "• Desarrollar análisis predictivos"
             ]
             
-            for rec in general_recs:
-                p = tf.add_paragraph()
-                p.text = rec
-                p.font.size = Pt(14)
+            self._fill_bullets(tf, general_recs, PPT_SIZE_DETALLE)
         else:
             # Tomar las 5 recomendaciones más importantes
             top_recommendations = self.data['recomendaciones'][:5]
             
-            for i, rec in enumerate(top_recommendations):
-                if i == 0:
-                    tf.text = f"• {rec['descripcion']}"
-                    tf.paragraphs[0].font.size = Pt(14)
-                else:
-                    p = tf.add_paragraph()
-                    p.text = f"• {rec['descripcion']}"
-                    p.font.size = Pt(14)
+            bullets = [f"• {rec['descripcion']}" for rec in top_recommendations]
+            tf.text = bullets[0]
+            tf.paragraphs[0].font.size = PPT_SIZE_DETALLE
+            self._fill_bullets(tf, bullets[1:], PPT_SIZE_DETALLE)
     
     def generate_complete_report(self, output_dir: str = None) -> Tuple[str, str]:
         """
@@ -962,9 +1015,12 @@ class TelefonicaReportGenerator:
         excel_path = os.path.join(output_dir, f"Informe_Semanal_Telefonica_{timestamp}.xlsx")
         ppt_path = os.path.join(output_dir, f"Presentacion_Semanal_Telefonica_{timestamp}.pptx")
         
-        # Generar ambos reportes
-        excel_file = self.generate_excel_report(excel_path)
-        ppt_file = self.generate_powerpoint_report(ppt_path)
+        # Generar ambos reportes en paralelo (solo leen self.data y escriben archivos distintos)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            excel_future = executor.submit(self.generate_excel_report, excel_path)
+            ppt_future = executor.submit(self.generate_powerpoint_report, ppt_path)
+            excel_file = excel_future.result()
+            ppt_file = ppt_future.result()
         
         logger.info(f"🎉 Reportes completos generados en: {output_dir}")
         
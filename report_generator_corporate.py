@@ -10,11 +10,16 @@ Basado en la estructura de presentaciones corporativas existentes.
 
 import pandas as pd
 import numpy as np
-from datetime import datetime, date, timedelta
+from datetime import datetime, date, timezone
 import tempfile
 import os
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from operator import itemgetter
 from typing import Dict, List, Optional, Tuple
+from xml.sax.saxutils import escape
 import logging
+from zipfile import ZipFile, ZIP_DEFLATED
 
 # Excel libraries
 import openpyxl
@@ -22,6 +27,9 @@ from openpyxl.styles import Font, PatternFill, Border, Side, Alignment
 from openpyxl.utils.dataframe import dataframe_to_rows
 from openpyxl.chart import BarChart, LineChart, Reference
 from openpyxl.worksheet.table import Table, TableStyleInfo
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.utils import column_index_from_string
+from openpyxl.writer.excel import ExcelWriter
 
 # PowerPoint libraries
 from pptx import Presentation
@@ -32,9 +40,34 @@ from pptx.enum.shapes import MSO_SHAPE
 from pptx.chart.data import CategoryChartData
 from pptx.enum.chart import XL_CHART_TYPE
 from pptx.enum.dml import MSO_THEME_COLOR
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
 
 logger = logging.getLogger(__name__)
 
+# Tamaños de fuente de los bloques de texto de los slides
+PPT_SIZE_RESUMEN = Pt(20)
+PPT_SIZE_ENCABEZADO = Pt(16)
+PPT_SIZE_TEXTO = Pt(14)
+PPT_SIZE_DETALLE = Pt(12)
+PPT_SIZE_NOTA = Pt(11)
+
+# Tamaños de fuente de portada, cierre y logo
+PPT_SIZE_PORTADA = Pt(32)
+PPT_SIZE_PERIODO = Pt(18)
+PPT_SIZE_CIERRE = Pt(48)
+PPT_SIZE_LOGO = Pt(72)
+
+# Cajas de texto (left, top, width, height) de portada y cierre
+PPT_PORTADA_TITULO_BOX = (Inches(1), Inches(2.5), Inches(8), Inches(1.5))
+PPT_PORTADA_PERIODO_BOX = (Inches(1), Inches(4.5), Inches(8), Inches(1))
+PPT_PORTADA_LOGO_BOX = (Inches(4), Inches(6), Inches(2), Inches(1))
+PPT_CIERRE_TEXTO_BOX = (Inches(2), Inches(3), Inches(6), Inches(2))
+PPT_CIERRE_LOGO_BOX = (Inches(4), Inches(5.5), Inches(2), Inches(1))
+
+# Atributo XML de negrita para <a:defRPr> según la fila sea negrita o no
+PPT_ATRIBUTO_NEGRITA = {True: ' b="1"', False: ''}
+
 class TelefonicaCorporateReportGenerator:
     """
     Generador de reportes corporativos para Telefónica del Perú
@@ -54,6 +87,34 @@ class TelefonicaCorporateReportGenerator:
         'dark_gray': '666666'
     }
     
+    # Colores corporativos ya convertidos para python-pptx
+    RGB_COLORS = {nombre: RGBColor.from_string(hex_color) for nombre, hex_color in COLORS.items()}
+    
+    # Estilos Excel compartidos por todas las hojas
+    XL_FILLS = {
+        nombre: PatternFill(start_color=hex_color, end_color=hex_color, fill_type="solid")
+        for nombre, hex_color in COLORS.items()
+    }
+    XL_HEADER_FONT = Font(bold=True, color=COLORS['white'])
+    XL_TITLE_FONT = Font(bold=True, size=14, color=COLORS['white'])
+    XL_MAIN_TITLE_FONT = Font(bold=True, size=16, color=COLORS['white'])
+    XL_BOLD_FONT = Font(bold=True)
+    XL_RAW_TITLE_FONT = Font(bold=True, size=14)
+    XL_RESUMEN_FONT = Font(bold=True, size=12)
+    XL_CUMPLIMIENTO_BAJO_FONT = Font(bold=True, size=12, color='FF0000')
+    XL_CUMPLIMIENTO_OK_FONT = Font(bold=True, size=12, color='00AA00')
+    
+    # Nivel de compresión zip del xlsx (1 = rápido, 9 = archivo más chico)
+    XL_COMPRESSLEVEL = 1
+    
+    # Buffer de escritura de los archivos de salida (xlsx y pptx)
+    OUTPUT_BUFFER_SIZE = 1 << 20
+    
+    # Textos fijos repetidos en las filas de las hojas Excel
+    XL_SIN_DATO = "N/A"
+    XL_EN_ANALISIS = "En análisis"
+    XL_ANALISIS_EN_PROGRESO = "Análisis en progreso"
+    
     # Jerarquía de datos
     HIERARCHY = {
         'CARTERA': ['Altas_Nuevas', 'Temprana', 'Fraccionamiento'],
@@ -61,6 +122,15 @@ class TelefonicaCorporateReportGenerator:
         'VENCIMIENTO': ['05', '09', '13', '17', '21', '25', '01']  # Días del mes
     }
     
+    # Vencimientos analizados en contactabilidad y cumplimiento (ventanas acumuladas)
+    VENCIMIENTOS = ['05', '09', '13', '17']
+    
+    # Columnas de gestiones que se convierten a category al cargar
+    CATEGORICAL_COLUMNS = ['contactabilidad', 'es_pdp', 'tipo_cartera', 'servicio', 'ejecutivo_homologado']
+    
+    # Columnas enteras de gestiones que se reducen al menor tipo entero al cargar
+    INTEGER_COLUMNS = ['dias_desde_asignacion', 'cod_luna']
+    
     # KPIs corporativos específicos
     KPIS = {
         'contactabilidad': '%CONT',
@@ -74,6 +144,24 @@ class TelefonicaCorporateReportGenerator:
         'efectividad': 'EFECTIVIDAD%'
     }
     
+    # Contenido fijo de los slides 11 (estrategia) y 12 (bot de voz)
+    ESTRATEGIAS = (
+        "• Enriquecimiento de datos internos",
+        "• Validación y scoring de teléfonos",
+        "• Gestión multifono personalizada",
+        "• Implementación de intelligence BI",
+        "• Automatización con bots de voz",
+        "• Seguimiento y optimización continua"
+    )
+    BOT_FEATURES = (
+        "• Identificación automática del titular",
+        "• Validación de datos personales",
+        "• Información de deuda pendiente",
+        "• Gestión de promesas de pago",
+        "• Escalamiento a agentes humanos",
+        "• Registro automático de resultados"
+    )
+    
     def __init__(self, fecha_inicio: str, fecha_fin: str, mes_actual: str = None, mes_anterior: str = None):
         """
         Inicializar generador corporativo
@@ -86,8 +174,9 @@ class TelefonicaCorporateReportGenerator:
         """
         self.fecha_inicio = fecha_inicio
         self.fecha_fin = fecha_fin
-        self.mes_actual = mes_actual or datetime.strptime(fecha_fin, '%Y-%m-%d').strftime('%B')
-        self.mes_anterior = mes_anterior or (datetime.strptime(fecha_fin, '%Y-%m-%d') - timedelta(days=30)).strftime('%B')
+        fin = pd.Timestamp(fecha_fin)
+        self.mes_actual = mes_actual or fin.strftime('%B')
+        self.mes_anterior = mes_anterior or (fin - pd.DateOffset(months=1)).strftime('%B')
         self.fecha_generacion = datetime.now()
         
         # Estructura de datos corporativa
@@ -100,7 +189,7 @@ class TelefonicaCorporateReportGenerator:
             'kpis_resultados': {},         # Slide 7: Tasa cierre y conversión
             'kpis_esfuerzo': {},           # Slide 8: Intensidad y efectividad
             'cumplimiento_objetivo': {},   # Slide 9: Resultados vs metas
-            'ranking_agentes': {},         # Slide 10: Performance individual
+            'ranking_agentes': [],         # Slide 10: Performance individual
             'estrategia_gestion': {},      # Slide 11: Metodología
             'implementacion_bot': {}       # Slide 12: Tecnología
         }
@@ -116,72 +205,169 @@ class TelefonicaCorporateReportGenerator:
         """
         logger.info("Procesando datos con estructura corporativa Telefónica")
         
-        # Procesar asignación por cartera
+        # Procesar asignación por cartera (no depende de gestiones)
         self._process_asignacion_cartera(calendario_df, asignacion_df)
         
+        # Sin gestiones no hay KPIs: se mantienen las estructuras vacías
+        if gestiones_df.empty:
+            logger.info("Sin gestiones en el período, KPIs corporativos vacíos")
+            return
+        
+        # Columnas auxiliares compartidas por todos los procesamientos
+        gestiones_df = self._prepare_gestiones(gestiones_df)
+        
         # Procesar KPIs integrales
         self._process_kpis_integrales(gestiones_df, kpis_campania)
         
         # Procesar evolución temporal
         self._process_kpis_evolucion(gestiones_df)
         
+        # Agregados acumulados por servicio y vencimiento (slides 5 y 9)
+        self._vcto_agg = self._compute_vcto_stats(gestiones_df)
+        
         # Procesar análisis de contactabilidad
-        self._process_kpis_contactabilidad(gestiones_df)
+        self._process_kpis_contactabilidad(self._vcto_agg)
+        
+        # Agregados por servicio compartidos por slides 6-8 (una sola pasada)
+        self._servicio_agg = self._compute_servicio_stats(gestiones_df)
         
         # Procesar tipos de contacto
-        self._process_kpis_tipos_contacto(gestiones_df)
+        self._process_kpis_tipos_contacto(self._servicio_agg)
         
         # Procesar resultados
-        self._process_kpis_resultados(gestiones_df)
+        self._process_kpis_resultados(self._servicio_agg)
         
         # Procesar esfuerzo y efectividad
-        self._process_kpis_esfuerzo(gestiones_df)
+        self._process_kpis_esfuerzo(self._servicio_agg)
         
         # Procesar cumplimiento de objetivos
-        self._process_cumplimiento_objetivo(gestiones_df, pagos_df)
+        self._process_cumplimiento_objetivo(self._vcto_agg, pagos_df)
         
         # Procesar ranking de agentes
         self._process_ranking_agentes(gestiones_df)
         
         logger.info("Datos corporativos procesados exitosamente")
     
+    def _prepare_gestiones(self, gestiones_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Preparar gestiones para los procesamientos corporativos
+        
+        - Columnas de texto repetitivas pasan a dtype category, de modo que los
+          filtros (== 'FIJA', == 'SI', ...) comparan códigos enteros.
+        - Agrega flags enteros (_ce, _ci, _pdp) calculados una sola vez; los
+          procesamientos suman estas columnas en lugar de volver a comparar
+          strings y filtrar el DataFrame completo en cada KPI.
+        - vcto_bucket asigna cada gestión al primer vencimiento que la incluye;
+          las ventanas acumuladas "<= vcto" se obtienen con cumsum por bucket.
+        - Columnas enteras se reducen al menor tipo entero que las contiene.
+          Los montos se mantienen en float64 porque alimentan sumas de dinero.
+        - La fecha de gestión se parsea una sola vez a datetime64.
+        """
+        # Única copia del DataFrame de entrada (el astype); el resto de columnas
+        # se asignan en el lugar sobre esa copia para no duplicar el frame en
+        # cada paso (pandas 2.1 no tiene copy-on-write por defecto)
+        categoricas = [col for col in self.CATEGORICAL_COLUMNS if col in gestiones_df.columns]
+        df = gestiones_df.astype({col: 'category' for col in categoricas})
+        
+        for col in self.INTEGER_COLUMNS:
+            if col in df.columns and pd.api.types.is_integer_dtype(df[col]):
+                df[col] = pd.to_numeric(df[col], downcast='integer')
+        
+        if 'date' in df.columns and not pd.api.types.is_datetime64_any_dtype(df['date']):
+            df['date'] = pd.to_datetime(df['date'], cache=True)
+        
+        df['_ce'] = (df['contactabilidad'] == 'CONTACTO_EFECTIVO').astype('int32')
+        df['_ci'] = (df['contactabilidad'] == 'CONTACTO_NO_EFECTIVO').astype('int32')
+        df['_pdp'] = (df['es_pdp'] == 'SI').astype('int32')
+        df['vcto_bucket'] = pd.cut(df['dias_desde_asignacion'],
+                                   bins=[-np.inf, 5, 9, 13, 17, np.inf],
+                                   labels=self.VENCIMIENTOS + ['99'])
+        return df
+    
+    def _compute_servicio_stats(self, gestiones_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Agregados por servicio (una fila por servicio con gestiones), en el
+        orden de HIERARCHY['SERVICIO']
+        """
+        agg = gestiones_df.groupby('servicio', observed=True).agg(
+            total=('_ce', 'size'),
+            ce=('_ce', 'sum'),
+            ci=('_ci', 'sum'),
+            pdp=('_pdp', 'sum'),
+            luna=('cod_luna', 'nunique'),
+            mc=('monto_compromiso', 'sum'),
+            me=('monto_exigible', 'sum')
+        )
+        servicios = [servicio for servicio in self.HIERARCHY['SERVICIO'] if servicio in agg.index]
+        return agg.loc[servicios]
+    
+    def _compute_vcto_stats(self, gestiones_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Agregados acumulados por servicio y vencimiento: cada fila (servicio, vcto)
+        resume las gestiones con dias_desde_asignacion <= vcto
+        """
+        agg = gestiones_df.groupby(['servicio', 'vcto_bucket'], observed=True).agg(
+            total=('_ce', 'size'),
+            ce=('_ce', 'sum'),
+            mc=('monto_compromiso', 'sum'),
+            me=('monto_exigible', 'sum')
+        )
+        
+        # Completar buckets vacíos de cada servicio observado para que el
+        # acumulado "<= vcto" no se salte vencimientos sin gestiones propias
+        completo = pd.MultiIndex.from_product(
+            [agg.index.unique(level='servicio'), gestiones_df['vcto_bucket'].cat.categories],
+            names=agg.index.names
+        )
+        return agg.reindex(completo, fill_value=0).groupby(level='servicio', sort=False).cumsum()
+    
+    @staticmethod
+    def _ratio(numerador: pd.Series, denominador: pd.Series, factor: float = 100) -> pd.Series:
+        """Cociente vectorizado que retorna 0 cuando el denominador es 0"""
+        return (numerador / denominador.where(denominador > 0) * factor).fillna(0)
+    
+    @staticmethod
+    def _kpis_to_dict(kpis: pd.DataFrame) -> Dict:
+        """Convertir un DataFrame de KPIs a {indice: {kpi: valor redondeado}}"""
+        return {
+            clave: {kpi: round(valor, 2) for kpi, valor in fila.items()}
+            for clave, fila in kpis.iterrows()
+        }
+    
     def _process_asignacion_cartera(self, calendario_df: pd.DataFrame, asignacion_df: pd.DataFrame) -> None:
         """Procesar datos de asignación por cartera (Slide 2)"""
         if calendario_df.empty or asignacion_df.empty:
             return
         
-        # Agrupar por cartera y servicio
-        asignacion_summary = {}
+        # Agrupar por cartera y servicio (una sola agregación vectorizada)
+        asignacion = pd.DataFrame({
+            'cartera': asignacion_df.get('tipo_cartera', 'Otro'),
+            'servicio': asignacion_df.get('servicio_normalizado', 'FIJA'),
+            'clientes': asignacion_df.get('clientes_asignados', 0)
+        }, index=asignacion_df.index)
         
-        for _, row in asignacion_df.iterrows():
-            cartera = row.get('tipo_cartera', 'Otro')
-            servicio = row.get('servicio_normalizado', 'FIJA')
-            clientes = row.get('clientes_asignados', 0)
-            
-            if cartera not in asignacion_summary:
-                asignacion_summary[cartera] = {'FIJA': 0, 'MOVIL': 0, 'total': 0}
-            
-            asignacion_summary[cartera][servicio] += clientes
-            asignacion_summary[cartera]['total'] += clientes
+        clientes_por_servicio = (
+            asignacion.groupby(['cartera', 'servicio'], sort=False, dropna=False)['clientes'].sum()
+            .unstack(fill_value=0)
+            .reindex(index=asignacion['cartera'].unique(), columns=self.HIERARCHY['SERVICIO'], fill_value=0)
+        )
+        clientes_por_servicio['total'] = clientes_por_servicio.sum(axis=1)
         
         # Procesar por vencimientos (extraer del archivo)
+        vencimientos = pd.DataFrame({
+            'vencimiento': calendario_df.get('vencimiento', 0),
+            'cartera': calendario_df.get('tipo_cartera', 'Otro'),
+            'suma_lineas': calendario_df.get('suma_lineas', 0)
+        }, index=calendario_df.index)
+        vencimientos['vencimiento'] = vencimientos['vencimiento'].astype(str).str.zfill(2)
+        
+        lineas_por_vencimiento = vencimientos.groupby(['vencimiento', 'cartera'], sort=False, dropna=False)['suma_lineas'].sum()
         vencimientos_data = {}
-        for _, row in calendario_df.iterrows():
-            archivo = row.get('archivo', '')
-            vencimiento = str(row.get('vencimiento', 0)).zfill(2)
-            suma_lineas = row.get('suma_lineas', 0)
-            cartera = row.get('tipo_cartera', 'Otro')
-            
-            if vencimiento not in vencimientos_data:
-                vencimientos_data[vencimiento] = {}
-            
-            if cartera not in vencimientos_data[vencimiento]:
-                vencimientos_data[vencimiento][cartera] = 0
-            
-            vencimientos_data[vencimiento][cartera] += suma_lineas
+        for (vencimiento, cartera), suma_lineas in lineas_por_vencimiento.items():
+            vencimientos_data.setdefault(vencimiento, {})[cartera] = suma_lineas
         
         self.data['asignacion_cartera'] = {
-            'resumen_cartera': asignacion_summary,
+            'resumen_cartera': clientes_por_servicio,  # DataFrame: cartera x [FIJA, MOVIL, total]
             'por_vencimiento': vencimientos_data,
             'comparativa_mensual': {
                 'mes_actual': self.mes_actual,
@@ -191,140 +377,108 @@ class TelefonicaCorporateReportGenerator:
     
     def _process_kpis_integrales(self, gestiones_df: pd.DataFrame, kpis_campania: List[Dict]) -> None:
         """Procesar KPIs integrales comparativos (Slide 3)"""
-        if gestiones_df.empty:
-            return
-        
-        # Calcular KPIs por cartera
-        kpis_por_cartera = {}
-        
-        for cartera in self.HIERARCHY['CARTERA']:
-            gestiones_cartera = gestiones_df[gestiones_df['tipo_cartera'] == cartera]
-            
-            if not gestiones_cartera.empty:
-                total_gestiones = len(gestiones_cartera)
-                contactos_efectivos = len(gestiones_cartera[gestiones_cartera['contactabilidad'] == 'CONTACTO_EFECTIVO'])
-                contactos_directos = contactos_efectivos  # Simplificado por ahora
-                contactos_indirectos = len(gestiones_cartera[gestiones_cartera['contactabilidad'] == 'CONTACTO_NO_EFECTIVO'])
-                compromisos = len(gestiones_cartera[gestiones_cartera['es_pdp'] == 'SI'])
-                
-                kpis_por_cartera[cartera] = {
-                    '%CONT': round(contactos_efectivos / total_gestiones * 100, 2) if total_gestiones > 0 else 0,
-                    'CD%': round(contactos_directos / total_gestiones * 100, 2) if total_gestiones > 0 else 0,
-                    'CI%': round(contactos_indirectos / total_gestiones * 100, 2) if total_gestiones > 0 else 0,
-                    '%CONV': round(compromisos / contactos_efectivos * 100, 2) if contactos_efectivos > 0 else 0,
-                    'INTENSIDAD': round(total_gestiones / gestiones_cartera['cod_luna'].nunique(), 2) if gestiones_cartera['cod_luna'].nunique() > 0 else 0,
-                    'EFECTIVIDAD%': round(gestiones_cartera['monto_compromiso'].sum() / gestiones_cartera['monto_exigible'].sum() * 100, 2) if gestiones_cartera['monto_exigible'].sum() > 0 else 0
-                }
-        
-        self.data['kpis_integrales'] = kpis_por_cartera
+        # Calcular agregados por cartera en una sola pasada (solo carteras de la jerarquía)
+        carteras = gestiones_df[gestiones_df['tipo_cartera'].isin(self.HIERARCHY['CARTERA'])]
+        agg = carteras.groupby('tipo_cartera', observed=True).agg(
+            total=('_ce', 'size'),
+            ce=('_ce', 'sum'),
+            ci=('_ci', 'sum'),
+            pdp=('_pdp', 'sum'),
+            luna=('cod_luna', 'nunique'),
+            mc=('monto_compromiso', 'sum'),
+            me=('monto_exigible', 'sum')
+        ).reindex(self.HIERARCHY['CARTERA'], fill_value=0)
+        agg = agg[agg['total'] > 0]
+        
+        # KPIs vectorizados sobre el agregado (contacto directo simplificado = CE)
+        kpis = pd.DataFrame({
+            '%CONT': self._ratio(agg['ce'], agg['total']),
+            'CD%': self._ratio(agg['ce'], agg['total']),
+            'CI%': self._ratio(agg['ci'], agg['total']),
+            '%CONV': self._ratio(agg['pdp'], agg['ce']),
+            'INTENSIDAD': self._ratio(agg['total'], agg['luna'], factor=1),
+            'EFECTIVIDAD%': self._ratio(agg['mc'], agg['me'])
+        })
+        
+        self.data['kpis_integrales'] = self._kpis_to_dict(kpis)
     
     def _process_kpis_evolucion(self, gestiones_df: pd.DataFrame) -> None:
         """Procesar evolución temporal de KPIs (Slide 4)"""
-        if gestiones_df.empty:
-            return
-        
-        # Agrupar por fecha y calcular KPIs diarios
-        gestiones_df['fecha'] = pd.to_datetime(gestiones_df['date']).dt.date
-        evolucion_diaria = {}
-        
-        for fecha in gestiones_df['fecha'].unique():
-            gestiones_dia = gestiones_df[gestiones_df['fecha'] == fecha]
-            
-            total_gestiones = len(gestiones_dia)
-            contactos_efectivos = len(gestiones_dia[gestiones_dia['contactabilidad'] == 'CONTACTO_EFECTIVO'])
-            
-            evolucion_diaria[fecha.strftime('%d')] = {
-                'CONTACTABILIDAD_%': round(contactos_efectivos / total_gestiones * 100, 2) if total_gestiones > 0 else 0,
-                'CD_%': round(contactos_efectivos / total_gestiones * 100, 2) if total_gestiones > 0 else 0,  # Simplificado
-                'CI_%': round(len(gestiones_dia[gestiones_dia['contactabilidad'] == 'CONTACTO_NO_EFECTIVO']) / total_gestiones * 100, 2) if total_gestiones > 0 else 0,
-                'TC_%': round(contactos_efectivos / total_gestiones * 100, 2) if total_gestiones > 0 else 0,  # Simplificado
-                'CONVERSION_%': round(len(gestiones_dia[gestiones_dia['es_pdp'] == 'SI']) / contactos_efectivos * 100, 2) if contactos_efectivos > 0 else 0,
-                'INTENSIDAD': round(total_gestiones / gestiones_dia['cod_luna'].nunique(), 2) if gestiones_dia['cod_luna'].nunique() > 0 else 0
-            }
+        # Agrupar por fecha y calcular KPIs diarios en una sola pasada
+        # (date ya es datetime64, ver _prepare_gestiones)
+        fechas = gestiones_df['date'].dt.normalize()
+        agg = gestiones_df.groupby(fechas, sort=False).agg(
+            total=('_ce', 'size'),
+            ce=('_ce', 'sum'),
+            ci=('_ci', 'sum'),
+            pdp=('_pdp', 'sum'),
+            luna=('cod_luna', 'nunique')
+        )
+        
+        # CD y TC simplificados = contactabilidad
+        kpis = pd.DataFrame({
+            'CONTACTABILIDAD_%': self._ratio(agg['ce'], agg['total']),
+            'CD_%': self._ratio(agg['ce'], agg['total']),
+            'CI_%': self._ratio(agg['ci'], agg['total']),
+            'TC_%': self._ratio(agg['ce'], agg['total']),
+            'CONVERSION_%': self._ratio(agg['pdp'], agg['ce']),
+            'INTENSIDAD': self._ratio(agg['total'], agg['luna'], factor=1)
+        })
+        
+        evolucion_diaria = {
+            fecha.strftime('%d'): {kpi: round(valor, 2) for kpi, valor in fila.items()}
+            for fecha, fila in kpis.iterrows()
+        }
         
         self.data['kpis_evolucion'] = evolucion_diaria
     
-    def _process_kpis_contactabilidad(self, gestiones_df: pd.DataFrame) -> None:
+    def _process_kpis_contactabilidad(self, vcto_agg: pd.DataFrame) -> None:
         """Procesar análisis de contactabilidad por servicio (Slide 5)"""
         contactabilidad_por_servicio = {}
         
         for servicio in self.HIERARCHY['SERVICIO']:
-            gestiones_servicio = gestiones_df[gestiones_df['servicio'] == servicio]
+            if servicio not in vcto_agg.index.get_level_values('servicio'):
+                continue
             
-            if not gestiones_servicio.empty:
-                # Por vencimiento
-                contactabilidad_vcto = {}
-                for vcto in ['05', '09', '13', '17']:
-                    # Filtrar por día de vencimiento (simplificado)
-                    gestiones_vcto = gestiones_servicio[gestiones_servicio['dias_desde_asignacion'] <= int(vcto)]
-                    
-                    if not gestiones_vcto.empty:
-                        total = len(gestiones_vcto)
-                        contactos = len(gestiones_vcto[gestiones_vcto['contactabilidad'] == 'CONTACTO_EFECTIVO'])
-                        contactabilidad_vcto[f'VCTO_{vcto}'] = round(contactos / total * 100, 2) if total > 0 else 0
-                
-                contactabilidad_por_servicio[servicio] = contactabilidad_vcto
+            # Por vencimiento (acumulado <= vcto, simplificado)
+            acumulado = vcto_agg.loc[servicio].reindex(self.VENCIMIENTOS)
+            acumulado = acumulado[acumulado['total'] > 0]
+            contactabilidad = self._ratio(acumulado['ce'], acumulado['total'])
+            
+            contactabilidad_por_servicio[servicio] = {
+                f'VCTO_{vcto}': round(valor, 2) for vcto, valor in contactabilidad.items()
+            }
         
         self.data['kpis_contactabilidad'] = contactabilidad_por_servicio
     
-    def _process_kpis_tipos_contacto(self, gestiones_df: pd.DataFrame) -> None:
+    def _process_kpis_tipos_contacto(self, servicio_agg: pd.DataFrame) -> None:
         """Procesar tipos de contacto CD vs CI (Slide 6)"""
-        tipos_contacto = {}
-        
-        for servicio in self.HIERARCHY['SERVICIO']:
-            gestiones_servicio = gestiones_df[gestiones_df['servicio'] == servicio]
-            
-            if not gestiones_servicio.empty:
-                total = len(gestiones_servicio)
-                cd = len(gestiones_servicio[gestiones_servicio['contactabilidad'] == 'CONTACTO_EFECTIVO'])
-                ci = len(gestiones_servicio[gestiones_servicio['contactabilidad'] == 'CONTACTO_NO_EFECTIVO'])
-                
-                tipos_contacto[servicio] = {
-                    'CONTACTO_DIRECTO_%': round(cd / total * 100, 2) if total > 0 else 0,
-                    'CONTACTO_INDIRECTO_%': round(ci / total * 100, 2) if total > 0 else 0
-                }
+        kpis = pd.DataFrame({
+            'CONTACTO_DIRECTO_%': self._ratio(servicio_agg['ce'], servicio_agg['total']),
+            'CONTACTO_INDIRECTO_%': self._ratio(servicio_agg['ci'], servicio_agg['total'])
+        })
         
-        self.data['kpis_tipos_contacto'] = tipos_contacto
+        self.data['kpis_tipos_contacto'] = self._kpis_to_dict(kpis)
     
-    def _process_kpis_resultados(self, gestiones_df: pd.DataFrame) -> None:
+    def _process_kpis_resultados(self, servicio_agg: pd.DataFrame) -> None:
         """Procesar KPIs de resultados (Slide 7)"""
-        resultados = {}
-        
-        for servicio in self.HIERARCHY['SERVICIO']:
-            gestiones_servicio = gestiones_df[gestiones_df['servicio'] == servicio]
-            
-            if not gestiones_servicio.empty:
-                contactos_efectivos = len(gestiones_servicio[gestiones_servicio['contactabilidad'] == 'CONTACTO_EFECTIVO'])
-                compromisos = len(gestiones_servicio[gestiones_servicio['es_pdp'] == 'SI'])
-                
-                resultados[servicio] = {
-                    'TASA_CIERRE_%': round(compromisos / contactos_efectivos * 100, 2) if contactos_efectivos > 0 else 0,
-                    'CONVERTIBILIDAD_%': round(compromisos / len(gestiones_servicio) * 100, 2) if len(gestiones_servicio) > 0 else 0
-                }
+        kpis = pd.DataFrame({
+            'TASA_CIERRE_%': self._ratio(servicio_agg['pdp'], servicio_agg['ce']),
+            'CONVERTIBILIDAD_%': self._ratio(servicio_agg['pdp'], servicio_agg['total'])
+        })
         
-        self.data['kpis_resultados'] = resultados
+        self.data['kpis_resultados'] = self._kpis_to_dict(kpis)
     
-    def _process_kpis_esfuerzo(self, gestiones_df: pd.DataFrame) -> None:
+    def _process_kpis_esfuerzo(self, servicio_agg: pd.DataFrame) -> None:
         """Procesar KPIs de esfuerzo y eficiencia (Slide 8)"""
-        esfuerzo = {}
+        kpis = pd.DataFrame({
+            'INTENSIDAD': self._ratio(servicio_agg['total'], servicio_agg['luna'], factor=1),
+            'EFECTIVIDAD_%': self._ratio(servicio_agg['mc'], servicio_agg['me'])
+        })
         
-        for servicio in self.HIERARCHY['SERVICIO']:
-            gestiones_servicio = gestiones_df[gestiones_df['servicio'] == servicio]
-            
-            if not gestiones_servicio.empty:
-                clientes_unicos = gestiones_servicio['cod_luna'].nunique()
-                total_gestiones = len(gestiones_servicio)
-                monto_recuperado = gestiones_servicio['monto_compromiso'].sum()
-                monto_exigible = gestiones_servicio['monto_exigible'].sum()
-                
-                esfuerzo[servicio] = {
-                    'INTENSIDAD': round(total_gestiones / clientes_unicos, 2) if clientes_unicos > 0 else 0,
-                    'EFECTIVIDAD_%': round(monto_recuperado / monto_exigible * 100, 2) if monto_exigible > 0 else 0
-                }
-        
-        self.data['kpis_esfuerzo'] = esfuerzo
+        self.data['kpis_esfuerzo'] = self._kpis_to_dict(kpis)
     
-    def _process_cumplimiento_objetivo(self, gestiones_df: pd.DataFrame, pagos_df: pd.DataFrame) -> None:
+    def _process_cumplimiento_objetivo(self, vcto_agg: pd.DataFrame, pagos_df: pd.DataFrame) -> None:
         """Procesar cumplimiento de objetivos (Slide 9)"""
         # Objetivos simulados (se pueden configurar externamente)
         objetivos_base = {
@@ -336,35 +490,35 @@ class TelefonicaCorporateReportGenerator:
         cumplimiento_general = 0
         peso_total = 0
         
+        servicios_con_gestiones = vcto_agg.index.get_level_values('servicio')
+        
         for servicio in self.HIERARCHY['SERVICIO']:
             cumplimiento[servicio] = {}
+            if servicio not in servicios_con_gestiones:
+                continue
             
-            for vcto in ['05', '09', '13', '17']:
-                # Filtrar gestiones por servicio y vencimiento
-                gestiones_filtradas = gestiones_df[
-                    (gestiones_df['servicio'] == servicio) & 
-                    (gestiones_df['dias_desde_asignacion'] <= int(vcto))
-                ]
+            # Gestiones acumuladas por servicio y vencimiento
+            acumulado = vcto_agg.loc[servicio].reindex(self.VENCIMIENTOS)
+            acumulado = acumulado[acumulado['total'] > 0]
+            recupero = self._ratio(acumulado['mc'], acumulado['me'])
+            
+            for vcto, monto_exigible in acumulado['me'].items():
+                recupero_real = round(recupero[vcto], 2)
+                
+                objetivo = objetivos_base.get(servicio, {}).get(vcto, 15.0)
+                cumplimiento_pct = round(recupero_real / objetivo * 100, 2) if objetivo > 0 else 0
+                peso = monto_exigible  # Peso basado en monto exigible
                 
-                if not gestiones_filtradas.empty:
-                    monto_recuperado = gestiones_filtradas['monto_compromiso'].sum()
-                    monto_exigible = gestiones_filtradas['monto_exigible'].sum()
-                    recupero_real = round(monto_recuperado / monto_exigible * 100, 2) if monto_exigible > 0 else 0
-                    
-                    objetivo = objetivos_base.get(servicio, {}).get(vcto, 15.0)
-                    cumplimiento_pct = round(recupero_real / objetivo * 100, 2) if objetivo > 0 else 0
-                    peso = monto_exigible  # Peso basado en monto exigible
-                    
-                    cumplimiento[servicio][f'VCTO_{vcto}'] = {
-                        'recupero_esperado': objetivo,
-                        'recupero_real': recupero_real,
-                        'cumplimiento_%': cumplimiento_pct,
-                        'peso': peso
-                    }
-                    
-                    # Acumular para cumplimiento general
-                    cumplimiento_general += cumplimiento_pct * peso
-                    peso_total += peso
+                cumplimiento[servicio][f'VCTO_{vcto}'] = {
+                    'recupero_esperado': objetivo,
+                    'recupero_real': recupero_real,
+                    'cumplimiento_%': cumplimiento_pct,
+                    'peso': peso
+                }
+                
+                # Acumular para cumplimiento general
+                cumplimiento_general += cumplimiento_pct * peso
+                peso_total += peso
         
         # Calcular cumplimiento general
         cumplimiento_general_pct = round(cumplimiento_general / peso_total, 2) if peso_total > 0 else 0
@@ -376,61 +530,44 @@ class TelefonicaCorporateReportGenerator:
     
     def _process_ranking_agentes(self, gestiones_df: pd.DataFrame) -> None:
         """Procesar ranking de agentes (Slide 10)"""
-        if gestiones_df.empty:
-            return
-        
-        # Agrupar por agente
-        ranking = []
-        agentes_stats = gestiones_df.groupby('ejecutivo_homologado').agg({
-            'cod_luna': 'count',  # Total gestiones
-            'contactabilidad': lambda x: (x == 'CONTACTO_EFECTIVO').sum(),  # CEF
-            'contactabilidad': lambda x: (x == 'CONTACTO_NO_EFECTIVO').sum(),  # NEF
-            'es_pdp': lambda x: (x == 'SI').sum(),  # Compromisos
-            'monto_compromiso': 'sum'  # Monto pagado
-        }).round(2)
-        
-        # Procesar cada agente
-        for agente, stats in agentes_stats.iterrows():
-            if agente and agente != 'AGENTE NO IDENTIFICADO':
-                gestiones_agente = gestiones_df[gestiones_df['ejecutivo_homologado'] == agente]
-                
-                total_gestiones = len(gestiones_agente)
-                cef = len(gestiones_agente[gestiones_agente['contactabilidad'] == 'CONTACTO_EFECTIVO'])
-                nef = len(gestiones_agente[gestiones_agente['contactabilidad'] == 'CONTACTO_NO_EFECTIVO'])
-                compromisos = len(gestiones_agente[gestiones_agente['es_pdp'] == 'SI'])
-                monto = gestiones_agente['monto_compromiso'].sum()
-                
-                convertibilidad = round(compromisos / total_gestiones * 100, 2) if total_gestiones > 0 else 0
-                tasa_cierre = round(compromisos / cef * 100, 2) if cef > 0 else 0
-                
-                ranking.append({
-                    'agente': agente,
-                    'gestiones': total_gestiones,
-                    'cef': cef,
-                    'nef': nef,
-                    'monto_pagado': round(monto, 2),
-                    'convertibilidad_%': convertibilidad,
-                    'tasa_cierre_%': tasa_cierre
-                })
-        
-        # Ordenar por convertibilidad
-        ranking.sort(key=lambda x: x['convertibilidad_%'], reverse=True)
+        # Agrupar por agente en una sola pasada (flags enteros precalculados)
+        agentes = gestiones_df.groupby('ejecutivo_homologado', observed=True).agg(
+            gestiones=('_ce', 'size'),
+            cef=('_ce', 'sum'),
+            nef=('_ci', 'sum'),
+            compromisos=('_pdp', 'sum'),
+            monto=('monto_compromiso', 'sum')
+        )
+        agentes = agentes.drop(['', 'AGENTE NO IDENTIFICADO'], errors='ignore')
+        
+        # KPIs por agente vectorizados
+        agentes['monto_pagado'] = agentes['monto'].round(2)
+        agentes['convertibilidad_%'] = self._ratio(agentes['compromisos'], agentes['gestiones']).round(2)
+        agentes['tasa_cierre_%'] = self._ratio(agentes['compromisos'], agentes['cef']).round(2)
+        
+        # Ordenar por convertibilidad (estable: empates mantienen orden por agente) - Top 20
+        top_agentes = agentes.sort_values('convertibilidad_%', ascending=False, kind='stable').head(20)
         
         # Asignar ranking y cuartiles
-        for i, agente_data in enumerate(ranking[:20]):  # Top 20
-            agente_data['ranking'] = i + 1
-            
-            # Asignar cuartil
-            if i < 5:
-                agente_data['cuartil'] = 'Q1 - Excelente'
-            elif i < 10:
-                agente_data['cuartil'] = 'Q2 - Bueno'
-            elif i < 15:
-                agente_data['cuartil'] = 'Q3 - Regular'
-            else:
-                agente_data['cuartil'] = 'Q4 - Necesita Mejora'
-        
-        self.data['ranking_agentes'] = ranking[:20]
+        cuartiles = ['Q1 - Excelente', 'Q2 - Bueno', 'Q3 - Regular', 'Q4 - Necesita Mejora']
+        columnas = ['gestiones', 'cef', 'nef', 'monto_pagado', 'convertibilidad_%', 'tasa_cierre_%']
+        ranking = [
+            {
+                'agente': agente,
+                'gestiones': int(gestiones),
+                'cef': int(cef),
+                'nef': int(nef),
+                'monto_pagado': monto_pagado,
+                'convertibilidad_%': convertibilidad,
+                'tasa_cierre_%': tasa_cierre,
+                'ranking': i + 1,
+                'cuartil': cuartiles[min(i // 5, 3)]
+            }
+            for i, (agente, gestiones, cef, nef, monto_pagado, convertibilidad, tasa_cierre)
+            in enumerate(top_agentes[columnas].itertuples(name=None))
+        ]
+        
+        self.data['ranking_agentes'] = ranking
     
     def generate_powerpoint_corporate(self, output_path: str = None) -> str:
         """
@@ -442,8 +579,10 @@ class TelefonicaCorporateReportGenerator:
         
         logger.info(f"Generando presentación corporativa: {output_path}")
         
-        # Crear presentación
+        # Crear presentación y resolver los layouts una sola vez
         prs = Presentation()
+        self._layout_blank = prs.slide_layouts[6]
+        self._layout_content = prs.slide_layouts[1]
         
         # Generar todos los slides corporativos
         self._create_slide_01_portada(prs)
@@ -461,435 +600,310 @@ class TelefonicaCorporateReportGenerator:
         self._create_slide_13_cierre(prs)
         
         # Guardar presentación
-        prs.save(output_path)
+        with open(output_path, 'wb', buffering=self.OUTPUT_BUFFER_SIZE) as output_file:
+            prs.save(output_file)
         logger.info(f"Presentación corporativa generada: {output_path}")
         
         return output_path
     
+    def _bulk_add_paragraphs(self, tf, rows: List[Tuple[str, Pt, bool]]) -> None:
+        """
+        Agregar párrafos (texto, tamaño, negrita) a un text frame en un solo bloque XML
+        
+        Equivale a tf.add_paragraph() + p.text + p.font.size/bold por fila, pero
+        arma todos los <a:p> en una cadena y los parsea una sola vez. Los saltos
+        de línea del texto se escriben como <a:br/>, igual que python-pptx.
+        """
+        if not rows:
+            return
+        
+        paragraphs = ''.join(
+            f'<a:p><a:pPr><a:defRPr sz="{size.centipoints}"{PPT_ATRIBUTO_NEGRITA[bold]}/></a:pPr>'
+            + '<a:br/>'.join(f'<a:r><a:t>{escape(linea)}</a:t></a:r>' if linea else '' for linea in text.split('\n'))
+            + '</a:p>'
+            for text, size, bold in rows
+        )
+        tx_body = parse_xml(f'<a:txBody {nsdecls("a")}>{paragraphs}</a:txBody>')
+        tf._txBody.extend(list(tx_body))
+    
+    def _new_content_slide(self, prs: Presentation, title_text: str):
+        """Agregar slide de título y contenido; retorna el text frame de contenido vacío"""
+        slide = prs.slides.add_slide(self._layout_content)
+        slide.shapes.title.text = title_text
+        
+        tf = slide.placeholders[1].text_frame
+        tf.clear()
+        return tf
+    
     def _create_slide_01_portada(self, prs: Presentation) -> None:
         """Slide 1: Portada corporativa"""
-        slide = prs.slides.add_slide(prs.slide_layouts[6])  # Blank
+        slide = prs.slides.add_slide(self._layout_blank)  # Blank
+        colores = self.RGB_COLORS
         
         # Fondo azul corporativo
         background = slide.background
         fill = background.fill
         fill.solid()
-        fill.fore_color.rgb = RGBColor.from_string(self.COLORS['movistar_blue'])
+        fill.fore_color.rgb = colores['movistar_blue']
         
         # Título principal
-        left = Inches(1)
-        top = Inches(2.5)
-        width = Inches(8)
-        height = Inches(1.5)
-        title_box = slide.shapes.add_textbox(left, top, width, height)
+        title_box = slide.shapes.add_textbox(*PPT_PORTADA_TITULO_BOX)
         tf = title_box.text_frame
         tf.text = "INFORME GESTIÓN COBRANZA – TELEFÓNICA PERÚ"
         
         # Formatear título
         p = tf.paragraphs[0]
-        p.font.size = Pt(32)
+        p.font.size = PPT_SIZE_PORTADA
         p.font.bold = True
-        p.font.color.rgb = RGBColor.from_string(self.COLORS['white'])
+        p.font.color.rgb = colores['white']
         p.alignment = PP_ALIGN.CENTER
         
         # Subtítulo con período
-        left = Inches(1)
-        top = Inches(4.5)
-        width = Inches(8)
-        height = Inches(1)
-        subtitle_box = slide.shapes.add_textbox(left, top, width, height)
+        subtitle_box = slide.shapes.add_textbox(*PPT_PORTADA_PERIODO_BOX)
         tf_sub = subtitle_box.text_frame
         tf_sub.text = f"Período: {self.fecha_inicio} - {self.fecha_fin}"
         
         p_sub = tf_sub.paragraphs[0]
-        p_sub.font.size = Pt(18)
-        p_sub.font.color.rgb = RGBColor.from_string(self.COLORS['white'])
+        p_sub.font.size = PPT_SIZE_PERIODO
+        p_sub.font.color.rgb = colores['white']
         p_sub.alignment = PP_ALIGN.CENTER
         
         # Logo simulado (texto)
-        left = Inches(4)
-        top = Inches(6)
-        width = Inches(2)
-        height = Inches(1)
-        logo_box = slide.shapes.add_textbox(left, top, width, height)
+        logo_box = slide.shapes.add_textbox(*PPT_PORTADA_LOGO_BOX)
         tf_logo = logo_box.text_frame
         tf_logo.text = "M"
         
         p_logo = tf_logo.paragraphs[0]
-        p_logo.font.size = Pt(72)
+        p_logo.font.size = PPT_SIZE_LOGO
         p_logo.font.bold = True
-        p_logo.font.color.rgb = RGBColor.from_string(self.COLORS['movistar_green'])
+        p_logo.font.color.rgb = colores['movistar_green']
         p_logo.alignment = PP_ALIGN.CENTER
     
     def _create_slide_02_asignacion_temprana(self, prs: Presentation) -> None:
         """Slide 2: Asignación Temprana - Comparativa de volumen y valor"""
-        slide = prs.slides.add_slide(prs.slide_layouts[1])
-        
-        title = slide.shapes.title
-        title.text = "ASIGNACIÓN TEMPRANA"
-        
-        content = slide.placeholders[1]
-        tf = content.text_frame
-        tf.clear()
+        tf = self._new_content_slide(prs, "ASIGNACIÓN TEMPRANA")
         
         # Resumen de asignación
         asignacion = self.data.get('asignacion_cartera', {})
-        resumen = asignacion.get('resumen_cartera', {})
+        resumen = asignacion.get('resumen_cartera', pd.DataFrame(columns=['FIJA', 'MOVIL', 'total']))
         
         tf.text = f"COMPARATIVA {self.mes_anterior.upper()} vs {self.mes_actual.upper()}"
         
         # Datos por cartera
-        for cartera, datos in resumen.items():
-            p = tf.add_paragraph()
-            p.text = f"• {cartera}: {datos['total']:,} clientes (FIJA: {datos['FIJA']:,}, MÓVIL: {datos['MOVIL']:,})"
-            p.font.size = Pt(14)
+        rows = [
+            (f"• {cartera}: {total:,} clientes (FIJA: {fija:,}, MÓVIL: {movil:,})", PPT_SIZE_TEXTO, False)
+            for cartera, fija, movil, total in resumen[['FIJA', 'MOVIL', 'total']].itertuples(name=None)
+        ]
         
         # Información de vencimientos
         vencimientos = asignacion.get('por_vencimiento', {})
         if vencimientos:
-            p = tf.add_paragraph()
-            p.text = f"\nDistribución por Vencimiento:"
-            p.font.size = Pt(16)
-            p.font.bold = True
+            rows.append(("\nDistribución por Vencimiento:", PPT_SIZE_ENCABEZADO, True))
             
             for vcto, datos in vencimientos.items():
                 total_vcto = sum(datos.values())
-                p = tf.add_paragraph()
-                p.text = f"• VCTO {vcto}: {total_vcto:,} clientes"
-                p.font.size = Pt(12)
+                rows.append((f"• VCTO {vcto}: {total_vcto:,} clientes", PPT_SIZE_DETALLE, False))
+        
+        self._bulk_add_paragraphs(tf, rows)
     
     def _create_slide_03_kpis_integrales(self, prs: Presentation) -> None:
         """Slide 3: KPIs Integrales - Dashboard comparativo"""
-        slide = prs.slides.add_slide(prs.slide_layouts[1])
-        
-        title = slide.shapes.title
-        title.text = "KPIS INTEGRALES TEMPRANA"
-        
-        content = slide.placeholders[1]
-        tf = content.text_frame
-        tf.clear()
+        tf = self._new_content_slide(prs, "KPIS INTEGRALES TEMPRANA")
         
         tf.text = f"COMPARATIVA {self.mes_anterior.upper()} vs {self.mes_actual.upper()}"
         
         # KPIs por cartera
         kpis = self.data.get('kpis_integrales', {})
         
+        rows = []
         for cartera, metricas in kpis.items():
-            p = tf.add_paragraph()
-            p.text = f"\n{cartera.upper()}:"
-            p.font.size = Pt(16)
-            p.font.bold = True
-            
-            for kpi, valor in metricas.items():
-                p = tf.add_paragraph()
-                p.text = f"  • {kpi}: {valor}%"
-                p.font.size = Pt(12)
+            rows.append((f"\n{cartera.upper()}:", PPT_SIZE_ENCABEZADO, True))
+            rows.extend((f"  • {kpi}: {valor}%", PPT_SIZE_DETALLE, False) for kpi, valor in metricas.items())
+        
+        self._bulk_add_paragraphs(tf, rows)
     
     def _create_slide_04_kpis_evolucion(self, prs: Presentation) -> None:
         """Slide 4: Evolución temporal de KPIs"""
-        slide = prs.slides.add_slide(prs.slide_layouts[1])
-        
-        title = slide.shapes.title
-        title.text = f"KPIS CARTERA TEMPRANA - {self.mes_actual.upper()}"
-        
-        content = slide.placeholders[1]
-        tf = content.text_frame
-        tf.clear()
+        tf = self._new_content_slide(prs, f"KPIS CARTERA TEMPRANA - {self.mes_actual.upper()}")
         
         tf.text = "EVOLUCIÓN DIARIA DE INDICADORES:"
         
         evolucion = self.data.get('kpis_evolucion', {})
         
-        if evolucion:
-            # Mostrar evolución por días
-            for dia, kpis in evolucion.items():
-                p = tf.add_paragraph()
-                p.text = f"\nDía {dia}:"
-                p.font.size = Pt(14)
-                p.font.bold = True
-                
-                for kpi, valor in kpis.items():
-                    p = tf.add_paragraph()
-                    p.text = f"  • {kpi}: {valor}%"
-                    p.font.size = Pt(11)
+        # Mostrar evolución por días
+        rows = []
+        for dia, kpis in evolucion.items():
+            rows.append((f"\nDía {dia}:", PPT_SIZE_TEXTO, True))
+            rows.extend((f"  • {kpi}: {valor}%", PPT_SIZE_NOTA, False) for kpi, valor in kpis.items())
+        
+        self._bulk_add_paragraphs(tf, rows)
     
     def _create_slide_05_kpis_contactabilidad(self, prs: Presentation) -> None:
         """Slide 5: Análisis de contactabilidad por servicio"""
-        slide = prs.slides.add_slide(prs.slide_layouts[1])
-        
-        title = slide.shapes.title
-        title.text = "KPIS CARTERA TEMPRANA - CONTACTABILIDAD"
-        
-        content = slide.placeholders[1]
-        tf = content.text_frame
-        tf.clear()
+        tf = self._new_content_slide(prs, "KPIS CARTERA TEMPRANA - CONTACTABILIDAD")
         
         tf.text = "CONTACTABILIDAD POR SERVICIO Y VENCIMIENTO:"
         
         contactabilidad = self.data.get('kpis_contactabilidad', {})
         
+        rows = []
         for servicio, datos in contactabilidad.items():
-            p = tf.add_paragraph()
-            p.text = f"\nSERVICIO {servicio}:"
-            p.font.size = Pt(16)
-            p.font.bold = True
-            
-            for vcto, valor in datos.items():
-                p = tf.add_paragraph()
-                p.text = f"  • {vcto}: {valor}%"
-                p.font.size = Pt(12)
+            rows.append((f"\nSERVICIO {servicio}:", PPT_SIZE_ENCABEZADO, True))
+            rows.extend((f"  • {vcto}: {valor}%", PPT_SIZE_DETALLE, False) for vcto, valor in datos.items())
+        
+        self._bulk_add_paragraphs(tf, rows)
     
     def _create_slide_06_kpis_tipos_contacto(self, prs: Presentation) -> None:
         """Slide 6: Tipos de contacto (CD vs CI)"""
-        slide = prs.slides.add_slide(prs.slide_layouts[1])
-        
-        title = slide.shapes.title
-        title.text = "KPIS CARTERA TEMPRANA - TIPOS DE CONTACTO"
-        
-        content = slide.placeholders[1]
-        tf = content.text_frame
-        tf.clear()
+        tf = self._new_content_slide(prs, "KPIS CARTERA TEMPRANA - TIPOS DE CONTACTO")
         
         tf.text = "CONTACTO DIRECTO vs CONTACTO INDIRECTO:"
         
         tipos_contacto = self.data.get('kpis_tipos_contacto', {})
         
+        rows = []
         for servicio, datos in tipos_contacto.items():
-            p = tf.add_paragraph()
-            p.text = f"\nSERVICIO {servicio}:"
-            p.font.size = Pt(16)
-            p.font.bold = True
-            
-            for tipo, valor in datos.items():
-                p = tf.add_paragraph()
-                p.text = f"  • {tipo}: {valor}%"
-                p.font.size = Pt(12)
+            rows.append((f"\nSERVICIO {servicio}:", PPT_SIZE_ENCABEZADO, True))
+            rows.extend((f"  • {tipo}: {valor}%", PPT_SIZE_DETALLE, False) for tipo, valor in datos.items())
+        
+        self._bulk_add_paragraphs(tf, rows)
     
     def _create_slide_07_kpis_resultados(self, prs: Presentation) -> None:
         """Slide 7: KPIs de resultados (Tasa cierre y conversión)"""
-        slide = prs.slides.add_slide(prs.slide_layouts[1])
-        
-        title = slide.shapes.title
-        title.text = "KPIS CARTERA TEMPRANA - RESULTADOS"
-        
-        content = slide.placeholders[1]
-        tf = content.text_frame
-        tf.clear()
+        tf = self._new_content_slide(prs, "KPIS CARTERA TEMPRANA - RESULTADOS")
         
         tf.text = "TASA DE CIERRE Y CONVERTIBILIDAD:"
         
         resultados = self.data.get('kpis_resultados', {})
         
+        rows = []
         for servicio, datos in resultados.items():
-            p = tf.add_paragraph()
-            p.text = f"\nSERVICIO {servicio}:"
-            p.font.size = Pt(16)
-            p.font.bold = True
-            
-            for kpi, valor in datos.items():
-                p = tf.add_paragraph()
-                p.text = f"  • {kpi}: {valor}%"
-                p.font.size = Pt(12)
+            rows.append((f"\nSERVICIO {servicio}:", PPT_SIZE_ENCABEZADO, True))
+            rows.extend((f"  • {kpi}: {valor}%", PPT_SIZE_DETALLE, False) for kpi, valor in datos.items())
+        
+        self._bulk_add_paragraphs(tf, rows)
     
     def _create_slide_08_kpis_esfuerzo(self, prs: Presentation) -> None:
         """Slide 8: KPIs de esfuerzo y efectividad"""
-        slide = prs.slides.add_slide(prs.slide_layouts[1])
-        
-        title = slide.shapes.title
-        title.text = "KPIS CARTERA TEMPRANA - ESFUERZO Y EFECTIVIDAD"
-        
-        content = slide.placeholders[1]
-        tf = content.text_frame
-        tf.clear()
+        tf = self._new_content_slide(prs, "KPIS CARTERA TEMPRANA - ESFUERZO Y EFECTIVIDAD")
         
         tf.text = "INTENSIDAD Y EFECTIVIDAD:"
         
         esfuerzo = self.data.get('kpis_esfuerzo', {})
         
+        rows = []
         for servicio, datos in esfuerzo.items():
-            p = tf.add_paragraph()
-            p.text = f"\nSERVICIO {servicio}:"
-            p.font.size = Pt(16)
-            p.font.bold = True
-            
-            for kpi, valor in datos.items():
-                p = tf.add_paragraph()
-                p.text = f"  • {kpi}: {valor}"
-                p.font.size = Pt(12)
+            rows.append((f"\nSERVICIO {servicio}:", PPT_SIZE_ENCABEZADO, True))
+            rows.extend((f"  • {kpi}: {valor}", PPT_SIZE_DETALLE, False) for kpi, valor in datos.items())
+        
+        self._bulk_add_paragraphs(tf, rows)
     
     def _create_slide_09_cumplimiento_objetivo(self, prs: Presentation) -> None:
         """Slide 9: Cumplimiento de objetivos"""
-        slide = prs.slides.add_slide(prs.slide_layouts[1])
-        
-        title = slide.shapes.title
-        title.text = "CUMPLIMIENTO DE OBJETIVO - TEMPRANA"
-        
-        content = slide.placeholders[1]
-        tf = content.text_frame
-        tf.clear()
+        tf = self._new_content_slide(prs, "CUMPLIMIENTO DE OBJETIVO - TEMPRANA")
         
         cumplimiento = self.data.get('cumplimiento_objetivo', {})
         cumplimiento_general = cumplimiento.get('cumplimiento_general', 0)
         
         tf.text = f"CUMPLIMIENTO GENERAL: {cumplimiento_general}%"
-        tf.paragraphs[0].font.size = Pt(20)
-        tf.paragraphs[0].font.bold = True
+        font = tf.paragraphs[0].font
+        font.size = PPT_SIZE_RESUMEN
+        font.bold = True
         
         # Detalle por servicio y vencimiento
         por_servicio = cumplimiento.get('por_servicio', {})
         
+        rows = []
         for servicio, vencimientos in por_servicio.items():
-            p = tf.add_paragraph()
-            p.text = f"\n{servicio}:"
-            p.font.size = Pt(16)
-            p.font.bold = True
-            
-            for vcto, datos in vencimientos.items():
-                esperado = datos['recupero_esperado']
-                real = datos['recupero_real']
-                cumplimiento_pct = datos['cumplimiento_%']
-                
-                p = tf.add_paragraph()
-                p.text = f"  • {vcto}: {real}% vs {esperado}% objetivo ({cumplimiento_pct}% cumplimiento)"
-                p.font.size = Pt(11)
+            rows.append((f"\n{servicio}:", PPT_SIZE_ENCABEZADO, True))
+            rows.extend(
+                (f"  • {vcto}: {datos['recupero_real']}% vs {datos['recupero_esperado']}% objetivo "
+                 f"({datos['cumplimiento_%']}% cumplimiento)", PPT_SIZE_NOTA, False)
+                for vcto, datos in vencimientos.items()
+            )
+        
+        self._bulk_add_paragraphs(tf, rows)
     
     def _create_slide_10_ranking_agentes(self, prs: Presentation) -> None:
         """Slide 10: Ranking de agentes"""
-        slide = prs.slides.add_slide(prs.slide_layouts[1])
-        
-        title = slide.shapes.title
-        title.text = "RANKING DE AGENTES - TEMPRANA"
-        
-        content = slide.placeholders[1]
-        tf = content.text_frame
-        tf.clear()
+        tf = self._new_content_slide(prs, "RANKING DE AGENTES - TEMPRANA")
         
         tf.text = "TOP 10 AGENTES POR CONVERTIBILIDAD:"
         
         ranking = self.data.get('ranking_agentes', [])
         
-        for agente_data in ranking[:10]:
-            ranking_pos = agente_data['ranking']
-            agente = agente_data['agente']
-            convertibilidad = agente_data['convertibilidad_%']
-            cuartil = agente_data['cuartil']
-            
-            p = tf.add_paragraph()
-            p.text = f"{ranking_pos}. {agente}: {convertibilidad}% ({cuartil})"
-            p.font.size = Pt(12)
+        rows = [
+            (f"{agente['ranking']}. {agente['agente']}: {agente['convertibilidad_%']}% ({agente['cuartil']})",
+             PPT_SIZE_DETALLE, False)
+            for agente in islice(ranking, 10)
+        ]
+        
+        self._bulk_add_paragraphs(tf, rows)
     
     def _create_slide_11_estrategia_gestion(self, prs: Presentation) -> None:
         """Slide 11: Estrategia de gestión"""
-        slide = prs.slides.add_slide(prs.slide_layouts[1])
-        
-        title = slide.shapes.title
-        title.text = "ESTRATEGIA DE GESTIÓN"
-        
-        content = slide.placeholders[1]
-        tf = content.text_frame
-        tf.clear()
+        tf = self._new_content_slide(prs, "ESTRATEGIA DE GESTIÓN")
         
         tf.text = "METODOLOGÍA DE TRABAJO:"
         
-        estrategias = [
-            "• Enriquecimiento de datos internos",
-            "• Validación y scoring de teléfonos",
-            "• Gestión multifono personalizada",
-            "• Implementación de intelligence BI",
-            "• Automatización con bots de voz",
-            "• Seguimiento y optimización continua"
-        ]
-        
-        for estrategia in estrategias:
-            p = tf.add_paragraph()
-            p.text = estrategia
-            p.font.size = Pt(14)
+        self._bulk_add_paragraphs(tf, [(estrategia, PPT_SIZE_TEXTO, False) for estrategia in self.ESTRATEGIAS])
     
     def _create_slide_12_implementacion_bot(self, prs: Presentation) -> None:
         """Slide 12: Implementación de bot"""
-        slide = prs.slides.add_slide(prs.slide_layouts[1])
-        
-        title = slide.shapes.title
-        title.text = f"IMPLEMENTACIÓN BOT - {self.mes_actual.upper()}"
-        
-        content = slide.placeholders[1]
-        tf = content.text_frame
-        tf.clear()
+        tf = self._new_content_slide(prs, f"IMPLEMENTACIÓN BOT - {self.mes_actual.upper()}")
         
         tf.text = "AUTOMATIZACIÓN CON BOT DE VOZ:"
         
-        bot_features = [
-            "• Identificación automática del titular",
-            "• Validación de datos personales",
-            "• Información de deuda pendiente",
-            "• Gestión de promesas de pago",
-            "• Escalamiento a agentes humanos",
-            "• Registro automático de resultados"
-        ]
-        
-        for feature in bot_features:
-            p = tf.add_paragraph()
-            p.text = feature
-            p.font.size = Pt(14)
+        rows = [(feature, PPT_SIZE_TEXTO, False) for feature in self.BOT_FEATURES]
         
         # Estadísticas del bot si están disponibles
-        p = tf.add_paragraph()
-        p.text = f"\nResultados del período:"
-        p.font.size = Pt(16)
-        p.font.bold = True
+        rows.append(("\nResultados del período:", PPT_SIZE_ENCABEZADO, True))
         
         # Datos simplificados del voicebot
-        p = tf.add_paragraph()
-        p.text = f"• Gestiones automatizadas: Variable según período"
-        p.font.size = Pt(12)
+        rows.append(("• Gestiones automatizadas: Variable según período", PPT_SIZE_DETALLE, False))
+        rows.append(("• Tasa de contactabilidad bot: En proceso de optimización", PPT_SIZE_DETALLE, False))
         
-        p = tf.add_paragraph()
-        p.text = f"• Tasa de contactabilidad bot: En proceso de optimización"
-        p.font.size = Pt(12)
+        self._bulk_add_paragraphs(tf, rows)
     
     def _create_slide_13_cierre(self, prs: Presentation) -> None:
         """Slide 13: Cierre"""
-        slide = prs.slides.add_slide(prs.slide_layouts[6])  # Blank
+        slide = prs.slides.add_slide(self._layout_blank)  # Blank
+        colores = self.RGB_COLORS
         
         # Fondo azul corporativo
         background = slide.background
         fill = background.fill
         fill.solid()
-        fill.fore_color.rgb = RGBColor.from_string(self.COLORS['movistar_blue'])
+        fill.fore_color.rgb = colores['movistar_blue']
         
         # Texto de agradecimiento
-        left = Inches(2)
-        top = Inches(3)
-        width = Inches(6)
-        height = Inches(2)
-        thanks_box = slide.shapes.add_textbox(left, top, width, height)
+        thanks_box = slide.shapes.add_textbox(*PPT_CIERRE_TEXTO_BOX)
         tf = thanks_box.text_frame
         tf.text = "Gracias!!"
         
         p = tf.paragraphs[0]
-        p.font.size = Pt(48)
+        p.font.size = PPT_SIZE_CIERRE
         p.font.bold = True
-        p.font.color.rgb = RGBColor.from_string(self.COLORS['white'])
+        p.font.color.rgb = colores['white']
         p.alignment = PP_ALIGN.CENTER
         
         # Logo simulado
-        left = Inches(4)
-        top = Inches(5.5)
-        width = Inches(2)
-        height = Inches(1)
-        logo_box = slide.shapes.add_textbox(left, top, width, height)
+        logo_box = slide.shapes.add_textbox(*PPT_CIERRE_LOGO_BOX)
         tf_logo = logo_box.text_frame
         tf_logo.text = "M"
         
         p_logo = tf_logo.paragraphs[0]
-        p_logo.font.size = Pt(72)
+        p_logo.font.size = PPT_SIZE_LOGO
         p_logo.font.bold = True
-        p_logo.font.color.rgb = RGBColor.from_string(self.COLORS['movistar_green'])
+        p_logo.font.color.rgb = colores['movistar_green']
         p_logo.alignment = PP_ALIGN.CENTER
     
     def generate_excel_corporate(self, output_path: str = None) -> str:
         """
         Generar Excel corporativo con estructura detallada
+        
+        Usa openpyxl en modo write-only: las filas se escriben en streaming
+        con ws.append() en lugar de mantener la grilla de celdas en memoria.
         """
         if output_path is None:
             timestamp = self.fecha_generacion.strftime('%Y%m%d_%H%M%S')
@@ -897,211 +911,212 @@ class TelefonicaCorporateReportGenerator:
         
         logger.info(f"Generando Excel corporativo: {output_path}")
         
-        # Crear workbook
-        wb = openpyxl.Workbook()
-        wb.remove(wb.active)
+        # Crear workbook en modo write-only (sin hoja por defecto)
+        wb = openpyxl.Workbook(write_only=True)
+        
+        # Crear hojas especializadas; las de detalle solo si hay datos para ellas
+        hojas_detalle = [
+            ('kpis_integrales', self._create_excel_kpis_por_cartera),
+            ('kpis_contactabilidad', self._create_excel_analisis_servicios),
+            ('ranking_agentes', self._create_excel_ranking_detallado),
+            ('cumplimiento_objetivo', self._create_excel_cumplimiento_objetivos)
+        ]
         
-        # Crear hojas especializadas
         self._create_excel_resumen_ejecutivo_corp(wb)
-        self._create_excel_kpis_por_cartera(wb)
-        self._create_excel_analisis_servicios(wb)
-        self._create_excel_ranking_detallado(wb)
-        self._create_excel_cumplimiento_objetivos(wb)
+        for clave, crear_hoja in hojas_detalle:
+            if self.data.get(clave):
+                crear_hoja(wb)
         self._create_excel_data_raw(wb)
         
         # Guardar archivo
-        wb.save(output_path)
+        self._save_workbook(wb, output_path)
         logger.info(f"Excel corporativo generado: {output_path}")
         
         return output_path
     
+    def _save_workbook(self, wb: openpyxl.Workbook, output_path: str) -> None:
+        """
+        Guardar workbook con compresión zip XL_COMPRESSLEVEL
+        
+        Equivale a wb.save() (que siempre usa el nivel por defecto de zlib) pero
+        permite elegir el nivel: 1 comprime bastante más rápido a cambio de un
+        archivo algo más grande. El archivo se escribe con un buffer de
+        OUTPUT_BUFFER_SIZE para reducir las llamadas de escritura al disco.
+        Aplica las mismas validaciones que wb.save() y, si la escritura falla,
+        elimina el archivo parcial para no dejar un .xlsx truncado.
+        """
+        if wb.read_only:
+            raise TypeError("Workbook is read-only")
+        if wb.write_only and not wb.worksheets:
+            wb.create_sheet()
+        
+        try:
+            with open(output_path, 'wb', buffering=self.OUTPUT_BUFFER_SIZE) as output_file:
+                with ZipFile(output_file, 'w', ZIP_DEFLATED, allowZip64=True,
+                             compresslevel=self.XL_COMPRESSLEVEL) as archive:
+                    wb.properties.modified = datetime.now(tz=timezone.utc).replace(tzinfo=None)
+                    ExcelWriter(wb, archive).save()
+        except Exception:
+            if os.path.exists(output_path):
+                os.remove(output_path)
+            raise
+    
+    def _xl_cell(self, ws, value, font: Font = None, fill: PatternFill = None) -> WriteOnlyCell:
+        """Crear celda con estilo para una hoja write-only"""
+        cell = WriteOnlyCell(ws, value=value)
+        if font is not None:
+            cell.font = font
+        if fill is not None:
+            cell.fill = fill
+        return cell
+    
+    def _xl_title(self, ws, title: str, last_col: str, font: Font, color: str) -> None:
+        """Escribir título (fila 1) con fondo corporativo y combinar celdas"""
+        ws.append([self._xl_cell(ws, title, font, self.XL_FILLS[color])])
+        ws.merged_cells.add(f'A1:{last_col}1')
+    
+    def _xl_header_row(self, ws, headers: List[str], color: str) -> None:
+        """Escribir fila de encabezados con fondo corporativo"""
+        fill = self.XL_FILLS[color]
+        ws.append([self._xl_cell(ws, header, self.XL_HEADER_FONT, fill) for header in headers])
+    
+    def _xl_widths(self, ws, last_col: str, width: float) -> None:
+        """
+        Ancho uniforme para las columnas A..last_col (antes del primer append)
+        
+        Se escribe como un solo <col min=1 max=N> en lugar de una entrada por columna.
+        """
+        dimension = ws.column_dimensions['A']
+        dimension.min, dimension.max = 1, column_index_from_string(last_col)
+        dimension.width = width
+    
     def _create_excel_resumen_ejecutivo_corp(self, wb: openpyxl.Workbook) -> None:
         """Excel: Hoja de resumen ejecutivo corporativo"""
         ws = wb.create_sheet("Resumen Ejecutivo")
+        self._xl_widths(ws, 'E', 20)
         
         # Título principal
-        ws['A1'] = f"INFORME EJECUTIVO GESTIÓN COBRANZA - {self.mes_actual.upper()}"
-        ws['A1'].font = Font(bold=True, size=16, color=self.COLORS['white'])
-        ws['A1'].fill = PatternFill(start_color=self.COLORS['movistar_blue'], 
-                                   end_color=self.COLORS['movistar_blue'], fill_type="solid")
-        ws.merge_cells('A1:F1')
+        self._xl_title(ws, f"INFORME EJECUTIVO GESTIÓN COBRANZA - {self.mes_actual.upper()}", 'F', self.XL_MAIN_TITLE_FONT, 'movistar_blue')
+        ws.append([])
         
         # Comparativa mensual
-        headers = ['INDICADOR', f'{self.mes_anterior.upper()}', f'{self.mes_actual.upper()}', 'VARIACIÓN', 'ANÁLISIS']
-        for i, header in enumerate(headers, 1):
-            cell = ws.cell(row=3, column=i, value=header)
-            cell.font = Font(bold=True, color=self.COLORS['white'])
-            cell.fill = PatternFill(start_color=self.COLORS['movistar_dark_blue'], 
-                                   end_color=self.COLORS['movistar_dark_blue'], fill_type="solid")
-        
-        # Datos de KPIs integrales
+        headers = ['INDICADOR', self.mes_anterior.upper(), self.mes_actual.upper(), 'VARIACIÓN', 'ANÁLISIS']
+        self._xl_header_row(ws, headers, 'movistar_dark_blue')
+        
+        # Datos de KPIs integrales (mes anterior y variación no disponibles)
         kpis = self.data.get('kpis_integrales', {})
-        row = 4
         
         for cartera, metricas in kpis.items():
             for kpi, valor in metricas.items():
-                ws.cell(row=row, column=1, value=f"{cartera} - {kpi}")
-                ws.cell(row=row, column=2, value="N/A")  # Mes anterior (no disponible)
-                ws.cell(row=row, column=3, value=f"{valor}%")
-                ws.cell(row=row, column=4, value="N/A")  # Variación
-                ws.cell(row=row, column=5, value="En análisis")
-                row += 1
-        
-        # Ajustar anchos
-        for col in ['A', 'B', 'C', 'D', 'E']:
-            ws.column_dimensions[col].width = 20
+                ws.append([f"{cartera} - {kpi}", self.XL_SIN_DATO, f"{valor}%", self.XL_SIN_DATO, self.XL_EN_ANALISIS])
     
     def _create_excel_kpis_por_cartera(self, wb: openpyxl.Workbook) -> None:
         """Excel: KPIs detallados por cartera"""
         ws = wb.create_sheet("KPIs por Cartera")
+        self._xl_widths(ws, 'H', 15)
         
-        ws['A1'] = "KPIS DETALLADOS POR CARTERA"
-        ws['A1'].font = Font(bold=True, size=14, color=self.COLORS['white'])
-        ws['A1'].fill = PatternFill(start_color=self.COLORS['movistar_blue'], 
-                                   end_color=self.COLORS['movistar_blue'], fill_type="solid")
-        ws.merge_cells('A1:H1')
+        self._xl_title(ws, "KPIS DETALLADOS POR CARTERA", 'H', self.XL_TITLE_FONT, 'movistar_blue')
+        ws.append([])
         
         # Headers
         headers = ['CARTERA', 'CONTACTABILIDAD%', 'CONTACTO_DIRECTO%', 'CONTACTO_INDIRECTO%', 
                   'CONVERSIÓN%', 'INTENSIDAD', 'EFECTIVIDAD%', 'OBSERVACIONES']
-        
-        for i, header in enumerate(headers, 1):
-            cell = ws.cell(row=3, column=i, value=header)
-            cell.font = Font(bold=True, color=self.COLORS['white'])
-            cell.fill = PatternFill(start_color=self.COLORS['telefonica_orange'], 
-                                   end_color=self.COLORS['telefonica_orange'], fill_type="solid")
+        self._xl_header_row(ws, headers, 'telefonica_orange')
         
         # Datos
         kpis = self.data.get('kpis_integrales', {})
-        row = 4
         
         for cartera, metricas in kpis.items():
-            ws.cell(row=row, column=1, value=cartera)
-            ws.cell(row=row, column=2, value=metricas.get('%CONT', 0))
-            ws.cell(row=row, column=3, value=metricas.get('CD%', 0))
-            ws.cell(row=row, column=4, value=metricas.get('CI%', 0))
-            ws.cell(row=row, column=5, value=metricas.get('%CONV', 0))
-            ws.cell(row=row, column=6, value=metricas.get('INTENSIDAD', 0))
-            ws.cell(row=row, column=7, value=metricas.get('EFECTIVIDAD%', 0))
-            ws.cell(row=row, column=8, value="Análisis en progreso")
-            row += 1
-        
-        # Ajustar anchos
-        for col in ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H']:
-            ws.column_dimensions[col].width = 15
+            ws.append([
+                cartera,
+                metricas.get('%CONT', 0),
+                metricas.get('CD%', 0),
+                metricas.get('CI%', 0),
+                metricas.get('%CONV', 0),
+                metricas.get('INTENSIDAD', 0),
+                metricas.get('EFECTIVIDAD%', 0),
+                self.XL_ANALISIS_EN_PROGRESO
+            ])
     
     def _create_excel_analisis_servicios(self, wb: openpyxl.Workbook) -> None:
         """Excel: Análisis por servicios FIJA vs MÓVIL"""
         ws = wb.create_sheet("Análisis Servicios")
         
-        ws['A1'] = "ANÁLISIS DETALLADO POR SERVICIO"
-        ws['A1'].font = Font(bold=True, size=14, color=self.COLORS['white'])
-        ws['A1'].fill = PatternFill(start_color=self.COLORS['movistar_green'], 
-                                   end_color=self.COLORS['movistar_green'], fill_type="solid")
-        ws.merge_cells('A1:F1')
+        self._xl_title(ws, "ANÁLISIS DETALLADO POR SERVICIO", 'F', self.XL_TITLE_FONT, 'movistar_green')
+        ws.append([])
         
         # Datos de contactabilidad por servicio
         contactabilidad = self.data.get('kpis_contactabilidad', {})
         
-        row = 3
         for servicio, datos in contactabilidad.items():
-            ws.cell(row=row, column=1, value=f"SERVICIO {servicio}")
-            ws.cell(row=row, column=1).font = Font(bold=True)
-            row += 1
+            ws.append([self._xl_cell(ws, f"SERVICIO {servicio}", self.XL_BOLD_FONT)])
             
             for vcto, valor in datos.items():
-                ws.cell(row=row, column=2, value=vcto)
-                ws.cell(row=row, column=3, value=f"{valor}%")
-                row += 1
+                ws.append([None, vcto, f"{valor}%"])
             
-            row += 1  # Espacio entre servicios
+            ws.append([])  # Espacio entre servicios
     
     def _create_excel_ranking_detallado(self, wb: openpyxl.Workbook) -> None:
         """Excel: Ranking detallado de agentes"""
         ws = wb.create_sheet("Ranking Agentes")
+        self._xl_widths(ws, 'H', 15)
         
-        ws['A1'] = "RANKING DETALLADO DE AGENTES"
-        ws['A1'].font = Font(bold=True, size=14, color=self.COLORS['white'])
-        ws['A1'].fill = PatternFill(start_color=self.COLORS['telefonica_blue'], 
-                                   end_color=self.COLORS['telefonica_blue'], fill_type="solid")
-        ws.merge_cells('A1:H1')
+        self._xl_title(ws, "RANKING DETALLADO DE AGENTES", 'H', self.XL_TITLE_FONT, 'telefonica_blue')
+        ws.append([])
         
         # Headers
         headers = ['RANKING', 'AGENTE', 'GESTIONES', 'CEF', 'NEF', 'MONTO_PAGADO', 
                   'CONVERTIBILIDAD%', 'CUARTIL']
-        
-        for i, header in enumerate(headers, 1):
-            cell = ws.cell(row=3, column=i, value=header)
-            cell.font = Font(bold=True, color=self.COLORS['white'])
-            cell.fill = PatternFill(start_color=self.COLORS['telefonica_light_blue'], 
-                                   end_color=self.COLORS['telefonica_light_blue'], fill_type="solid")
+        self._xl_header_row(ws, headers, 'telefonica_light_blue')
         
         # Datos del ranking
         ranking = self.data.get('ranking_agentes', [])
         
-        for i, agente_data in enumerate(ranking, 4):
-            ws.cell(row=i, column=1, value=agente_data['ranking'])
-            ws.cell(row=i, column=2, value=agente_data['agente'])
-            ws.cell(row=i, column=3, value=agente_data['gestiones'])
-            ws.cell(row=i, column=4, value=agente_data['cef'])
-            ws.cell(row=i, column=5, value=agente_data['nef'])
-            ws.cell(row=i, column=6, value=agente_data['monto_pagado'])
-            ws.cell(row=i, column=7, value=agente_data['convertibilidad_%'])
-            ws.cell(row=i, column=8, value=agente_data['cuartil'])
-        
-        # Ajustar anchos
-        for col in ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H']:
-            ws.column_dimensions[col].width = 15
+        fila_agente = itemgetter('ranking', 'agente', 'gestiones', 'cef', 'nef',
+                                 'monto_pagado', 'convertibilidad_%', 'cuartil')
+        for agente_data in ranking:
+            ws.append(fila_agente(agente_data))
     
     def _create_excel_cumplimiento_objetivos(self, wb: openpyxl.Workbook) -> None:
         """Excel: Cumplimiento de objetivos detallado"""
         ws = wb.create_sheet("Cumplimiento Objetivos")
         
-        ws['A1'] = "CUMPLIMIENTO DETALLADO DE OBJETIVOS"
-        ws['A1'].font = Font(bold=True, size=14, color=self.COLORS['white'])
-        ws['A1'].fill = PatternFill(start_color=self.COLORS['movistar_blue'], 
-                                   end_color=self.COLORS['movistar_blue'], fill_type="solid")
-        ws.merge_cells('A1:F1')
+        self._xl_title(ws, "CUMPLIMIENTO DETALLADO DE OBJETIVOS", 'F', self.XL_TITLE_FONT, 'movistar_blue')
+        ws.append([])
         
         # Cumplimiento general
         cumplimiento = self.data.get('cumplimiento_objetivo', {})
         cumplimiento_general = cumplimiento.get('cumplimiento_general', 0)
         
-        ws['A3'] = "CUMPLIMIENTO GENERAL:"
-        ws['B3'] = f"{cumplimiento_general}%"
-        ws['A3'].font = Font(bold=True, size=12)
-        ws['B3'].font = Font(bold=True, size=12, color='FF0000' if cumplimiento_general < 70 else '00AA00')
+        ws.append([
+            self._xl_cell(ws, "CUMPLIMIENTO GENERAL:", self.XL_RESUMEN_FONT),
+            self._xl_cell(ws, f"{cumplimiento_general}%",
+                          self.XL_CUMPLIMIENTO_BAJO_FONT if cumplimiento_general < 70 else self.XL_CUMPLIMIENTO_OK_FONT)
+        ])
+        ws.append([])
         
         # Headers detalle
         headers = ['SERVICIO', 'VENCIMIENTO', 'OBJETIVO%', 'REAL%', 'CUMPLIMIENTO%', 'PESO']
-        
-        for i, header in enumerate(headers, 1):
-            cell = ws.cell(row=5, column=i, value=header)
-            cell.font = Font(bold=True, color=self.COLORS['white'])
-            cell.fill = PatternFill(start_color=self.COLORS['telefonica_orange'], 
-                                   end_color=self.COLORS['telefonica_orange'], fill_type="solid")
+        self._xl_header_row(ws, headers, 'telefonica_orange')
         
         # Datos detallados
         por_servicio = cumplimiento.get('por_servicio', {})
-        row = 6
         
         for servicio, vencimientos in por_servicio.items():
             for vcto, datos in vencimientos.items():
-                ws.cell(row=row, column=1, value=servicio)
-                ws.cell(row=row, column=2, value=vcto)
-                ws.cell(row=row, column=3, value=datos['recupero_esperado'])
-                ws.cell(row=row, column=4, value=datos['recupero_real'])
-                ws.cell(row=row, column=5, value=datos['cumplimiento_%'])
-                ws.cell(row=row, column=6, value=round(datos['peso'], 0))
-                row += 1
+                ws.append([
+                    servicio,
+                    vcto,
+                    datos['recupero_esperado'],
+                    datos['recupero_real'],
+                    datos['cumplimiento_%'],
+                    round(datos['peso'], 0)
+                ])
     
     def _create_excel_data_raw(self, wb: openpyxl.Workbook) -> None:
         """Excel: Datos raw para análisis"""
         ws = wb.create_sheet("Datos Raw")
         
-        ws['A1'] = "DATOS CONSOLIDADOS PARA ANÁLISIS"
-        ws['A1'].font = Font(bold=True, size=14)
-        
         # Estructura de datos disponibles
         estructura = [
             "ESTRUCTURA DE DATOS DISPONIBLES:",
@@ -1125,10 +1140,15 @@ class TelefonicaCorporateReportGenerator:
             f"   - Mes anterior: {self.mes_anterior}"
         ]
         
-        for i, item in enumerate(estructura, 3):
-            ws.cell(row=i, column=1, value=item)
-            if item.startswith(("1.", "2.", "3.", "4.", "5.")):
-                ws.cell(row=i, column=1).font = Font(bold=True)
+        # Título, fila vacía y estructura (secciones numeradas en negrita) en una sola pasada
+        filas = [[self._xl_cell(ws, "DATOS CONSOLIDADOS PARA ANÁLISIS", self.XL_RAW_TITLE_FONT)], []]
+        filas.extend(
+            [self._xl_cell(ws, item, self.XL_BOLD_FONT)] if item.startswith(("1.", "2.", "3.", "4.", "5.")) else [item]
+            for item in estructura
+        )
+        
+        for fila in filas:
+            ws.append(fila)
     
     def generate_complete_corporate_report(self, output_dir: str = None) -> Tuple[str, str]:
         """
@@ -1142,9 +1162,12 @@ class TelefonicaCorporateReportGenerator:
         excel_path = os.path.join(output_dir, f"Informe_Detallado_Telefonica_{timestamp}.xlsx")
         ppt_path = os.path.join(output_dir, f"Informe_Gestion_Cobranza_Telefonica_{timestamp}.pptx")
         
-        # Generar ambos reportes corporativos
-        excel_file = self.generate_excel_corporate(excel_path)
-        ppt_file = self.generate_powerpoint_corporate(ppt_path)
+        # Generar ambos reportes corporativos en paralelo (solo leen self.data y escriben archivos distintos)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            excel_future = executor.submit(self.generate_excel_corporate, excel_path)
+            ppt_future = executor.submit(self.generate_powerpoint_corporate, ppt_path)
+            excel_file = excel_future.result()
+            ppt_file = ppt_future.result()
         
         logger.info(f"Reportes corporativos generados en: {output_dir}")
         
@@ -27,7 +27,6 @@ import logging
 # Excel libraries
 import openpyxl
 from openpyxl.styles import Font, PatternFill, Border, Side, Alignment, NamedStyle
-from openpyxl.utils.dataframe import dataframe_to_rows
 from openpyxl.chart import BarChart, LineChart, Reference, PieChart
 from openpyxl.chart.marker import DataPoint
 from openpyxl.drawing.colors import ColorChoice
@@ -81,6 +80,25 @@ class EnhancedTelefonicaReportGenerator:
         'intensidad_gestion_diaria': 1.2        # 1.2 gestiones por cliente/día
     }
     
+    # Objetivo de contactabilidad por canal (resuelto una sola vez)
+    BENCHMARK_CONTACTABILIDAD_CANAL = {
+        'CALL': BENCHMARKS['tasa_contactabilidad_call'],
+        'VOICEBOT': BENCHMARKS['tasa_contactabilidad_voicebot']
+    }
+    
+    # Columnas de gestiones usadas como claves de filtro y agrupación. Una lista
+    # de categorías declarada debe cubrir TODOS los valores que puede devolver
+    # la query de gestiones: cualquier otro valor se convierte en NaN al castear.
+    # Solo canal es fijo en la query ('CALL'/'VOICEBOT'); contactabilidad y
+    # es_pdp vienen de las tablas de homologación (p.ej. 'NO_HOMOLOGADO'), así
+    # que sus categorías se infieren de los datos.
+    CATEGORICAL_DTYPES = {
+        'canal': pd.CategoricalDtype(['CALL', 'VOICEBOT']),
+        'contactabilidad': 'category',
+        'tipo_cartera': 'category',
+        'es_pdp': 'category'
+    }
+    
     def __init__(self, fecha_inicio: str, fecha_fin: str):
         """
         Inicializar generador mejorado
@@ -151,9 +169,23 @@ class EnhancedTelefonicaReportGenerator:
             logger.warning("No hay datos de gestiones para procesar")
             return
         
-        # Separar por canal
-        call_data = gestiones_df[gestiones_df['canal'] == 'CALL'].copy()
-        voicebot_data = gestiones_df[gestiones_df['canal'] == 'VOICEBOT'].copy()
+        gestiones_df = gestiones_df.astype({
+            col: dtype for col, dtype in self.CATEGORICAL_DTYPES.items() if col in gestiones_df.columns
+        })
+        
+        # Flags enteros calculados una sola vez; los análisis por canal los suman
+        gestiones_df = gestiones_df.assign(
+            _ce=(gestiones_df['contactabilidad'] == 'CONTACTO_EFECTIVO').astype('int32'),
+            _ci=(gestiones_df['contactabilidad'] == 'CONTACTO_NO_EFECTIVO').astype('int32'),
+            _nc=(gestiones_df['contactabilidad'] == 'NO_CONTACTO').astype('int32'),
+            _pdp=(gestiones_df['es_pdp'] == 'SI').astype('int32')
+        )
+        
+        # Separar por canal (una sola partición, los análisis solo leen)
+        por_canal = dict(iter(gestiones_df.groupby('canal', observed=True, sort=False)))
+        sin_datos = gestiones_df.iloc[:0]
+        call_data = por_canal.get('CALL', sin_datos)
+        voicebot_data = por_canal.get('VOICEBOT', sin_datos)
         
         # Análisis CALL (mejorado)
         call_analysis = self._analyze_channel_performance(call_data, 'CALL')
@@ -179,12 +211,12 @@ class EnhancedTelefonicaReportGenerator:
         if channel_data.empty:
             return self._empty_channel_analysis()
         
-        # Métricas básicas
+        # Métricas básicas (sumas sobre los flags de _process_enhanced_gestiones)
         total_gestiones = len(channel_data)
-        contactos_efectivos = len(channel_data[channel_data['contactabilidad'] == 'CONTACTO_EFECTIVO'])
-        contactos_no_efectivos = len(channel_data[channel_data['contactabilidad'] == 'CONTACTO_NO_EFECTIVO'])
-        no_contactos = len(channel_data[channel_data['contactabilidad'] == 'NO_CONTACTO'])
-        compromisos = len(channel_data[channel_data['es_pdp'] == 'SI'])
+        contactos_efectivos = int(channel_data['_ce'].sum())
+        contactos_no_efectivos = int(channel_data['_ci'].sum())
+        no_contactos = int(channel_data['_nc'].sum())
+        compromisos = int(channel_data['_pdp'].sum())
         
         # Métricas financieras
         monto_compromisos = channel_data['monto_compromiso'].sum()
@@ -204,23 +236,26 @@ class EnhancedTelefonicaReportGenerator:
         tasa_compromiso = round(compromisos / max(contactos_efectivos, 1) * 100, 2)
         tasa_no_contacto = round(no_contactos / max(total_gestiones, 1) * 100, 2)
         
-        # Análisis por tipo de cartera
+        # Análisis por tipo de cartera (una sola agrupación)
         cartera_performance = {}
         if 'tipo_cartera' in channel_data.columns:
-            for cartera in channel_data['tipo_cartera'].unique():
-                cartera_data = channel_data[channel_data['tipo_cartera'] == cartera]
-                cartera_contactos = len(cartera_data[cartera_data['contactabilidad'] == 'CONTACTO_EFECTIVO'])
-                cartera_total = len(cartera_data)
-                
+            por_cartera = channel_data.groupby('tipo_cartera', observed=True, sort=False).agg(
+                gestiones=('cod_luna', 'size'),
+                contactos_efectivos=('_ce', 'sum'),
+                clientes_unicos=('cod_luna', 'nunique')
+            )
+            
+            for cartera, cartera_total, cartera_contactos, clientes in por_cartera.itertuples():
+                cartera_total, cartera_contactos = int(cartera_total), int(cartera_contactos)
                 cartera_performance[cartera] = {
                     'gestiones': cartera_total,
                     'contactos_efectivos': cartera_contactos,
                     'tasa_contactabilidad': round(cartera_contactos / max(cartera_total, 1) * 100, 2),
-                    'clientes_unicos': cartera_data['cod_luna'].nunique()
+                    'clientes_unicos': int(clientes)
                 }
         
         # Evaluación vs benchmarks
-        benchmark_contactabilidad = self.BENCHMARKS[f'tasa_contactabilidad_{channel_name.lower()}']
+        benchmark_contactabilidad = self.BENCHMARK_CONTACTABILIDAD_CANAL[channel_name]
         benchmark_compromiso = self.BENCHMARKS['tasa_compromiso']
         
         cumple_benchmark_contactabilidad = tasa_contactabilidad >= benchmark_contactabilidad
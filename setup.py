@@ -20,10 +20,14 @@ import sys
 import subprocess
 import json
 import argparse
+import re
 from pathlib import Path
 import shutil
 from datetime import datetime
 
+# Línea KEY=valor de un archivo .env (se ignoran comentarios y líneas sin '=')
+ENV_LINE_PATTERN = re.compile(r'^[ \t]*([^#\s=][^=\n]*)?=(.*?)[ \t\r]*$', re.MULTILINE)
+
 class FacoWeeklySetup:
     """Configurador automático del sistema FACO Weekly"""
     
@@ -151,12 +155,9 @@ class FacoWeeklySetup:
         """Leer archivo .env"""
         env_vars = {}
         try:
-            with open(env_file, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith('#') and '=' in line:
-                        key, value = line.split('=', 1)
-                        env_vars[key] = value.strip('"\'')
+            contenido = Path(env_file).read_text()
+            for key, value in ENV_LINE_PATTERN.findall(contenido):
+                env_vars[key] = value.strip('"\'')
         except Exception as e:
             print(f"Error leyendo .env: {e}")
         
@@ -6,23 +6,108 @@ Test Script Avanzado para FACO Weekly API v2.0
 Script actualizado para probar la funcionalidad avanzada con homologación.
 """
 
-import requests
 import json
 import sys
-from datetime import datetime, timedelta
+import os
+import time
+import hashlib
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from functools import lru_cache
 
 # Configuración
 API_BASE_URL = "http://localhost:8000"
 
-def test_health():
+# Timeout de conexión (segundos); el de lectura depende de cada endpoint
+CONNECT_TIMEOUT = 3
+
+@lru_cache(maxsize=1)
+def get_session():
+    """
+    Sesión HTTP compartida: todos los tests reutilizan la conexión keep-alive.
+    
+    Los 502/503/504 transitorios (por ejemplo mientras BigQuery arranca) y los
+    fallos de conexión se reintentan; si persisten se devuelve la última
+    respuesta. Los errores de lectura no se reintentan (read=False): un POST a
+    /process-advanced que agota sus 180 s no debe relanzar la query completa,
+    y así el timeout llega como requests.exceptions.Timeout. requests se
+    importa recién aquí, así el mensaje de uso y las respuestas en caché no
+    cargan la pila HTTP.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    
+    session = requests.Session()
+    session.mount("http://", HTTPAdapter(
+        max_retries=Retry(
+            total=2,
+            read=False,
+            backoff_factor=0.3,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset(["GET", "POST"]),
+            raise_on_status=False
+        ),
+        pool_connections=4,
+        pool_maxsize=16
+    ))
+    return session
+
+# Caché local de respuestas de /process-advanced por período
+CACHE_DIR = Path.home() / ".cache" / "faco"
+CACHE_TTL_SECONDS = 3600
+
+# Campos de homologación: (etiqueta, clave); se muestran con su porcentaje clave_pct
+HOMOLOGACION_FIELDS = (
+    ("❌ No homologadas", "no_homologadas"),
+    ("👤 Sin DNI", "sin_dni"),
+    ("🆔 Sin identificar", "ejecutivos_sin_identificar"),
+    ("⚖️ Peso cero", "peso_cero"),
+)
+
+# Campos de datos procesados y KPIs: (etiqueta, clave, formato del valor)
+DATOS_FIELDS = (
+    ("📅 Campañas calendario", "campañas_calendario", "{}"),
+    ("🎯 Gestiones unificadas", "gestiones_unificadas", "{:,}"),
+    ("👥 Asignaciones fact", "asignaciones_fact", "{:,}"),
+    ("💰 Pagos", "pagos", "{:,}"),
+)
+
+KPI_FIELDS = (
+    ("👥 Clientes gestionados", "clientes_gestionados", "{:,}"),
+    ("📞 Contactabilidad efectiva", "tasa_contactabilidad_efectiva", "{}%"),
+    ("🎯 Tasa PDP", "tasa_pdp", "{}%"),
+    ("💰 Monto compromisos", "monto_total_compromisos", "S/ {:,.2f}"),
+    ("🎫 Ticket promedio", "ticket_promedio_compromiso", "S/ {:,.2f}"),
+    ("📊 Cobertura gestión", "cobertura_gestion", "{}%"),
+)
+
+# Decodificador JSON: orjson si está instalado, si no la librería estándar
+try:
+    import orjson as json_backend
+except ImportError:
+    json_backend = json
+
+def load_json(response):
+    """Decodificar el cuerpo JSON de una respuesta directamente desde bytes"""
+    return json_backend.loads(response.content)
+
+def get_endpoint(path):
+    """GET de un endpoint del API (usado también para las consultas en paralelo)"""
+    return get_session().get(f"{API_BASE_URL}{path}", timeout=(CONNECT_TIMEOUT, 10))
+
+def test_health(pending=None):
     """Test de conectividad y salud del sistema avanzado"""
+    import requests
+    
     print("🔍 Verificando estado del sistema avanzado...")
     
     try:
-        response = requests.get(f"{API_BASE_URL}/health", timeout=10)
+        response = pending.result() if pending else get_endpoint("/health")
         
         if response.status_code == 200:
-            data = response.json()
+            data = load_json(response)
             print(f"✅ Sistema: {data['status']}")
             print(f"📊 BigQuery: {data['bigquery']}")
             
@@ -47,15 +132,15 @@ def test_health():
         print(f"❌ Error inesperado: {e}")
         return False
 
-def test_homologation_status():
+def test_homologation_status(pending=None):
     """Test específico del estado de homologación"""
     print("\n🔗 Verificando estado de homologación...")
     
     try:
-        response = requests.get(f"{API_BASE_URL}/homologation-status", timeout=10)
+        response = pending.result() if pending else get_endpoint("/homologation-status")
         
         if response.status_code == 200:
-            data = response.json()
+            data = load_json(response)
             print(f"✅ Estado: {data['status']}")
             
             print("\n📊 Tablas de Homologación:")
@@ -79,15 +164,15 @@ def test_homologation_status():
         print(f"❌ Error: {e}")
         return False
 
-def test_api_info():
+def test_api_info(pending=None):
     """Test de información general del API avanzado"""
     print("\nℹ️ Información del API Avanzado...")
     
     try:
-        response = requests.get(f"{API_BASE_URL}/", timeout=10)
+        response = pending.result() if pending else get_endpoint("/")
         
         if response.status_code == 200:
-            data = response.json()
+            data = load_json(response)
             print(f"📡 {data['message']}")
             print(f"🔢 Versión: {data['version']}")
             
@@ -107,101 +192,147 @@ def test_api_info():
         print(f"❌ Error: {e}")
         return False
 
-def test_advanced_processing(fecha_inicio=None, fecha_fin=None):
+def cache_path(fecha_inicio, fecha_fin):
+    """Archivo de caché para la respuesta avanzada de un período"""
+    key = hashlib.blake2b(f"{fecha_inicio}|{fecha_fin}".encode(), digest_size=16).hexdigest()
+    return CACHE_DIR / f"{key}.json"
+
+def load_cached_response(fecha_inicio, fecha_fin):
+    """Respuesta avanzada en caché si existe y no venció, si no None"""
+    path = cache_path(fecha_inicio, fecha_fin)
+    try:
+        if time.time() - path.stat().st_mtime < CACHE_TTL_SECONDS:
+            return json_backend.loads(path.read_bytes())
+    except (OSError, ValueError):
+        pass
+    return None
+
+def save_cached_response(fecha_inicio, fecha_fin, content):
+    """Guardar la respuesta avanzada en caché (escritura atómica)"""
+    path = cache_path(fecha_inicio, fecha_fin)
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_bytes(content)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"⚠️ No se pudo guardar la caché: {e}")
+
+def show_advanced_results(data):
+    """Imprimir el resultado del procesamiento avanzado"""
+    # El resultado se arma como lista de líneas y se imprime de una vez
+    lines = [
+        "✅ Procesamiento avanzado exitoso!",
+        f"📋 Estado: {data['status']}",
+        f"🔢 Versión: {data['version']}"
+    ]
+    
+    # Mostrar estado de homologación
+    homolog = data.get('homologacion', {})
+    if 'problemas_detectados' in homolog:
+        issues = homolog['problemas_detectados'].get
+        lines += [
+            "\n🔍 Análisis de Homologación:",
+            f"   📊 Total gestiones: {issues('total_gestiones', 0):,}"
+        ]
+        lines += [
+            f"   {label}: {issues(key, 0)} ({issues(f'{key}_pct', 0)}%)"
+            for label, key in HOMOLOGACION_FIELDS
+        ]
+    
+    # Mostrar datos procesados
+    datos = data.get('datos_procesados', {}).get
+    lines.append("\n📊 Datos Procesados:")
+    lines += [f"   {label}: {fmt.format(datos(key, 0))}" for label, key, fmt in DATOS_FIELDS]
+    
+    # Mostrar KPIs avanzados
+    kpis = data.get('kpis_avanzados', {})
+    if 'kpis_generales' in kpis:
+        kpis_gen = kpis['kpis_generales'].get
+        lines.append("\n📈 KPIs Avanzados:")
+        lines += [f"   {label}: {fmt.format(kpis_gen(key, 0))}" for label, key, fmt in KPI_FIELDS]
+    
+    # Mostrar análisis de contactabilidad
+    contact_analysis = data.get('analisis_contactabilidad', {})
+    if 'contactabilidad_distribucion' in contact_analysis:
+        lines.append("\n📊 Distribución Contactabilidad:")
+        lines += [
+            f"   📋 {tipo}: {cantidad}"
+            for tipo, cantidad in contact_analysis['contactabilidad_distribucion'].items()
+        ]
+    
+    # Mostrar top ejecutivos
+    ranking = data.get('ranking_ejecutivos', [])
+    if ranking:
+        lines.append(f"\n🏆 Top {len(ranking)} Ejecutivos:")
+        for i, exec_data in enumerate(ranking, 1):
+            get = exec_data.get
+            lines += [
+                f"   {i}. {get('ejecutivo', 'N/A')} ({get('canal', 'N/A')})",
+                f"      💼 DNI: {get('dni_ejecutivo', 'N/A')}",
+                f"      📞 Gestiones: {get('total_gestiones', 0)}",
+                f"      📈 Contactabilidad: {get('tasa_contactabilidad_efectiva', 0)}%",
+                f"      💰 Monto: S/ {get('monto_comprometido', 0):,.2f}",
+                f"      🏅 Score: {get('productividad_score', 0)}",
+                ""
+            ]
+    
+    # Mostrar resumen de campañas
+    campaigns = data.get('resumen_campañas', [])
+    if campaigns:
+        lines.append("📋 Resumen por Cartera:")
+        lines += [
+            f"   🎯 {campaign.get('cartera', 'N/A')}: {campaign.get('clientes_asignados', 0)} asignados"
+            for campaign in campaigns
+        ]
+    
+    print("\n".join(lines))
+
+def test_advanced_processing(fecha_inicio=None, fecha_fin=None, use_cache=True):
     """Test de procesamiento avanzado con homologación"""
     print("\n🧠 Probando procesamiento avanzado...")
     
     # Configurar fechas por defecto
     if not fecha_fin:
-        fecha_fin = datetime.now().strftime('%Y-%m-%d')
+        fecha_fin = date.today().isoformat()
     if not fecha_inicio:
-        fecha_inicio = (datetime.now() - timedelta(days=7)).strftime('%Y-%m-%d')
+        fecha_inicio = (date.today() - timedelta(days=7)).isoformat()
     
     print(f"📅 Período: {fecha_inicio} a {fecha_fin}")
     
+    # Respuesta reciente del mismo período: no se vuelve a procesar
+    if use_cache:
+        data = load_cached_response(fecha_inicio, fecha_fin)
+        if data is not None:
+            print("💾 Usando respuesta en caché local (--no-cache para reprocesar)")
+            show_advanced_results(data)
+            return True
+    
+    import requests
+    
     payload = {
         "fecha_inicio": fecha_inicio,
         "fecha_fin": fecha_fin
     }
     
     try:
-        response = requests.post(
+        response = get_session().post(
             f"{API_BASE_URL}/process-advanced",
             json=payload,
-            timeout=180  # 3 minutos para procesamiento avanzado
+            timeout=(CONNECT_TIMEOUT, 180)  # 3 minutos para procesamiento avanzado
         )
         
         if response.status_code == 200:
-            data = response.json()
-            
-            print("✅ Procesamiento avanzado exitoso!")
-            print(f"📋 Estado: {data['status']}")
-            print(f"🔢 Versión: {data['version']}")
-            
-            # Mostrar estado de homologación
-            homolog = data.get('homologacion', {})
-            if 'problemas_detectados' in homolog:
-                issues = homolog['problemas_detectados']
-                print(f"\n🔍 Análisis de Homologación:")
-                print(f"   📊 Total gestiones: {issues.get('total_gestiones', 0):,}")
-                print(f"   ❌ No homologadas: {issues.get('no_homologadas', 0)} ({issues.get('no_homologadas_pct', 0)}%)")
-                print(f"   👤 Sin DNI: {issues.get('sin_dni', 0)} ({issues.get('sin_dni_pct', 0)}%)")
-                print(f"   🆔 Sin identificar: {issues.get('ejecutivos_sin_identificar', 0)} ({issues.get('ejecutivos_sin_identificar_pct', 0)}%)")
-                print(f"   ⚖️ Peso cero: {issues.get('peso_cero', 0)} ({issues.get('peso_cero_pct', 0)}%)")
-            
-            # Mostrar datos procesados
-            datos = data.get('datos_procesados', {})
-            print(f"\n📊 Datos Procesados:")
-            print(f"   📅 Campañas calendario: {datos.get('campañas_calendario', 0)}")
-            print(f"   🎯 Gestiones unificadas: {datos.get('gestiones_unificadas', 0):,}")
-            print(f"   👥 Asignaciones fact: {datos.get('asignaciones_fact', 0):,}")
-            print(f"   💰 Pagos: {datos.get('pagos', 0):,}")
-            
-            # Mostrar KPIs avanzados
-            kpis = data.get('kpis_avanzados', {})
-            if 'kpis_generales' in kpis:
-                kpis_gen = kpis['kpis_generales']
-                print(f"\n📈 KPIs Avanzados:")
-                print(f"   👥 Clientes gestionados: {kpis_gen.get('clientes_gestionados', 0):,}")
-                print(f"   📞 Contactabilidad efectiva: {kpis_gen.get('tasa_contactabilidad_efectiva', 0)}%")
-                print(f"   🎯 Tasa PDP: {kpis_gen.get('tasa_pdp', 0)}%")
-                print(f"   💰 Monto compromisos: S/ {kpis_gen.get('monto_total_compromisos', 0):,.2f}")
-                print(f"   🎫 Ticket promedio: S/ {kpis_gen.get('ticket_promedio_compromiso', 0):,.2f}")
-                print(f"   📊 Cobertura gestión: {kpis_gen.get('cobertura_gestion', 0)}%")
-            
-            # Mostrar análisis de contactabilidad
-            contact_analysis = data.get('analisis_contactabilidad', {})
-            if 'contactabilidad_distribucion' in contact_analysis:
-                print(f"\n📊 Distribución Contactabilidad:")
-                for tipo, cantidad in contact_analysis['contactabilidad_distribucion'].items():
-                    print(f"   📋 {tipo}: {cantidad}")
-            
-            # Mostrar top ejecutivos
-            ranking = data.get('ranking_ejecutivos', [])
-            if ranking:
-                print(f"\n🏆 Top {len(ranking)} Ejecutivos:")
-                for i, exec_data in enumerate(ranking, 1):
-                    print(f"   {i}. {exec_data.get('ejecutivo', 'N/A')} ({exec_data.get('canal', 'N/A')})")
-                    print(f"      💼 DNI: {exec_data.get('dni_ejecutivo', 'N/A')}")
-                    print(f"      📞 Gestiones: {exec_data.get('total_gestiones', 0)}")
-                    print(f"      📈 Contactabilidad: {exec_data.get('tasa_contactabilidad_efectiva', 0)}%")
-                    print(f"      💰 Monto: S/ {exec_data.get('monto_comprometido', 0):,.2f}")
-                    print(f"      🏅 Score: {exec_data.get('productividad_score', 0)}")
-                    print()
-            
-            # Mostrar resumen de campañas
-            campaigns = data.get('resumen_campañas', [])
-            if campaigns:
-                print(f"📋 Resumen por Cartera:")
-                for campaign in campaigns:
-                    print(f"   🎯 {campaign.get('cartera', 'N/A')}: {campaign.get('clientes_asignados', 0)} asignados")
+            data = load_json(response)
+            save_cached_response(fecha_inicio, fecha_fin, response.content)
             
+            show_advanced_results(data)
             return True
             
         else:
             print(f"❌ Error en procesamiento: {response.status_code}")
             try:
-                error_data = response.json()
+                error_data = load_json(response)
                 print(f"💬 Detalle: {error_data.get('detail', 'Sin detalles')}")
             except:
                 print(f"💬 Respuesta: {response.text}")
@@ -219,22 +350,31 @@ def run_all_tests():
     print("🚀 INICIANDO TESTS FACO WEEKLY v2.0 (AVANZADO)")
     print("=" * 60)
     
-    # Test 1: Health check
-    if not test_health():
-        print("\n❌ Tests abortados: Sistema no disponible")
-        return False
-    
-    # Test 2: Estado de homologación
-    if not test_homologation_status():
-        print("\n⚠️ Advertencia: Problemas con tablas de homologación")
-    
-    # Test 3: Info del API
-    if not test_api_info():
-        print("\n⚠️ Advertencia: No se pudo obtener info del API")
+    # Tests 1-3 son GET independientes: se consultan en paralelo y los
+    # resultados se muestran en orden. La sesión se crea antes de usarla
+    # desde varios hilos.
+    get_session()
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        health, homolog, info = (
+            executor.submit(get_endpoint, path) for path in ("/health", "/homologation-status", "/")
+        )
+        
+        # Test 1: Health check
+        if not test_health(health):
+            print("\n❌ Tests abortados: Sistema no disponible")
+            return False
+        
+        # Test 2: Estado de homologación
+        if not test_homologation_status(homolog):
+            print("\n⚠️ Advertencia: Problemas con tablas de homologación")
+        
+        # Test 3: Info del API
+        if not test_api_info(info):
+            print("\n⚠️ Advertencia: No se pudo obtener info del API")
     
-    # Test 4: Procesamiento avanzado
+    # Test 4: Procesamiento avanzado (siempre contra el API, sin caché)
     print("\n" + "=" * 60)
-    if not test_advanced_processing():
+    if not test_advanced_processing(use_cache=False):
         print("\n❌ Test de procesamiento avanzado falló")
         return False
     
@@ -245,8 +385,11 @@ def run_all_tests():
 
 def main():
     """Función principal con opciones avanzadas"""
-    if len(sys.argv) > 1:
-        command = sys.argv[1].lower()
+    use_cache = "--no-cache" not in sys.argv
+    args = [arg for arg in sys.argv[1:] if arg != "--no-cache"]
+    
+    if args:
+        command = args[0].lower()
         
         if command == "health":
             test_health()
@@ -256,13 +399,13 @@ def main():
             test_api_info()
         elif command == "advanced":
             # Permitir fechas customizadas
-            fecha_inicio = sys.argv[2] if len(sys.argv) > 2 else None
-            fecha_fin = sys.argv[3] if len(sys.argv) > 3 else None
-            test_advanced_processing(fecha_inicio, fecha_fin)
+            fecha_inicio = args[1] if len(args) > 1 else None
+            fecha_fin = args[2] if len(args) > 2 else None
+            test_advanced_processing(fecha_inicio, fecha_fin, use_cache)
         elif command == "full":
             run_all_tests()
         else:
-            print("Uso: python test_api.py [health|homolog|info|advanced|full] [fecha_inicio] [fecha_fin]")
+            print("Uso: python test_api.py [health|homolog|info|advanced|full] [fecha_inicio] [fecha_fin] [--no-cache]")
             print("")
             print("Comandos disponibles:")
             print("  health    - Solo health check")
@@ -271,6 +414,9 @@ def main():
             print("  advanced  - Procesamiento avanzado")
             print("  full      - Todos los tests")
             print("")
+            print("Opciones:")
+            print("  --no-cache  - Ignorar la respuesta avanzada en caché (~/.cache/faco)")
+            print("")
             print("Ejemplos:")
             print("  python test_api.py advanced 2025-06-01 2025-06-12")
             print("  python test_api.py full")
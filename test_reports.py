@@ -15,49 +15,86 @@ Ejemplos:
     python test_reports.py --formato excel
 """
 
-import requests
 import json
-import argparse
 import sys
 import os
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
 import time
 from typing import Optional
 
+# Tamaño de bloque al guardar descargas en disco
+DOWNLOAD_CHUNK_SIZE = 1 << 16
+
+# Decodificador JSON: orjson si está instalado, si no la librería estándar
+try:
+    import orjson as json_backend
+except ImportError:
+    json_backend = json
+
+def load_json(response):
+    """Decodificar el cuerpo JSON de una respuesta directamente desde bytes"""
+    return json_backend.loads(response.content)
+
 class FacoReportsTester:
     """Tester para el sistema de reportes FACO Weekly"""
     
     def __init__(self, base_url: str = "http://localhost:8000"):
+        # requests se importa al crear el tester, no al validar argumentos
+        import requests
+        
         self.base_url = base_url
+        self.output_dir = "outputs"
         self.session = requests.Session()
         
-    def check_health(self) -> bool:
+    def batch_probe(self, ops: list) -> dict:
+        """
+        Consultar varios endpoints de estado en una sola llamada a /batch
+        
+        Retorna {endpoint: {'status_code', 'body'}}, o un dict vacío si el
+        servidor no soporta /batch (cada consulta se hace entonces por separado).
+        """
+        try:
+            response = self.session.post(f"{self.base_url}/batch", json={"ops": ops})
+            if response.status_code != 200:
+                return {}
+            return {result['op']: result for result in load_json(response)['results']}
+        except Exception:
+            return {}
+    
+    def _get_status(self, path: str, batch: Optional[dict] = None) -> tuple:
+        """(status_code, body) de un endpoint, tomado de /batch si está disponible"""
+        if batch and path in batch:
+            return batch[path]['status_code'], batch[path]['body']
+        response = self.session.get(f"{self.base_url}{path}")
+        return response.status_code, load_json(response) if response.status_code == 200 else None
+    
+    def check_health(self, batch: Optional[dict] = None) -> bool:
         """Verificar que el sistema esté funcionando"""
         try:
-            response = self.session.get(f"{self.base_url}/health")
-            if response.status_code == 200:
-                health_data = response.json()
+            status_code, health_data = self._get_status("/health", batch)
+            if status_code == 200:
                 print("✅ Sistema FACO Weekly funcionando correctamente")
                 print(f"   📊 Versión: {health_data.get('version', 'Unknown')}")
                 print(f"   🔌 BigQuery: {health_data.get('bigquery', 'Unknown')}")
                 print(f"   📋 Campañas en calendario: {health_data.get('calendario_vigencias', 0)}")
                 return True
             else:
-                print(f"❌ Error en health check: {response.status_code}")
+                print(f"❌ Error en health check: {status_code}")
                 return False
         except Exception as e:
             print(f"❌ No se puede conectar al sistema: {str(e)}")
             print("   💡 Asegúrate de que el servidor esté ejecutándose en http://localhost:8000")
             return False
     
-    def get_vigencias_status(self) -> dict:
+    def get_vigencias_status(self, batch: Optional[dict] = None) -> dict:
         """Obtener estado de vigencias del calendario"""
         try:
-            response = self.session.get(f"{self.base_url}/vigencias-status")
-            if response.status_code == 200:
-                return response.json()
+            status_code, vigencias = self._get_status("/vigencias-status", batch)
+            if status_code == 200:
+                return vigencias
             else:
-                print(f"⚠️ Error obteniendo vigencias: {response.status_code}")
+                print(f"⚠️ Error obteniendo vigencias: {status_code}")
                 return {}
         except Exception as e:
             print(f"❌ Error consultando vigencias: {str(e)}")
@@ -85,17 +122,17 @@ class FacoReportsTester:
         try:
             # Enviar solicitud
             print("\n⏳ Procesando datos y generando archivos...")
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
             
             response = self.session.post(
                 f"{self.base_url}/generate-reports",
                 params=payload
             )
             
-            elapsed_time = time.time() - start_time
+            elapsed_time = (time.perf_counter_ns() - start_ns) / 1e9
             
             if response.status_code == 200:
-                result = response.json()
+                result = load_json(response)
                 print(f"✅ Reportes generados exitosamente en {elapsed_time:.2f} segundos")
                 return result
             else:
@@ -109,75 +146,97 @@ class FacoReportsTester:
     
     def download_file(self, download_url: str, filename: str, tipo: str) -> bool:
         """Descargar archivo generado"""
+        ok, lines = self._download(self.session, download_url, filename, tipo)
+        print("\n".join(lines))
+        return ok
+    
+    def _download(self, session, download_url: str, filename: str, tipo: str) -> tuple:
+        """
+        Descargar archivo con la sesión indicada
+        
+        Devuelve (ok, líneas de progreso) en vez de imprimir, para que las
+        descargas en paralelo muestren su salida en orden y sin intercalarse.
+        """
+        lines = [f"📥 Descargando {tipo}: {filename}"]
         try:
-            print(f"📥 Descargando {tipo}: {filename}")
-            
-            response = self.session.get(f"{self.base_url}{download_url}")
-            
-            if response.status_code == 200:
-                # Guardar archivo localmente
-                output_path = os.path.join("outputs", filename)
-                os.makedirs("outputs", exist_ok=True)
-                
-                with open(output_path, 'wb') as f:
-                    f.write(response.content)
-                
-                file_size = os.path.getsize(output_path) / 1024 / 1024  # MB
-                print(f"✅ {tipo} descargado: {output_path} ({file_size:.2f} MB)")
-                return True
-            else:
-                print(f"❌ Error descargando {tipo}: {response.status_code}")
-                return False
+            with session.get(f"{self.base_url}{download_url}", stream=True) as response:
+                if response.status_code == 200:
+                    # Guardar archivo localmente, por bloques a medida que llegan
+                    output_path = os.path.join(self.output_dir, filename)
+                    
+                    bytes_written = 0
+                    with open(output_path, 'wb') as f:
+                        for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                            bytes_written += f.write(chunk)
+                    
+                    file_size = bytes_written / 1024 / 1024  # MB
+                    lines.append(f"✅ {tipo} descargado: {output_path} ({file_size:.2f} MB)")
+                    return True, lines
+                else:
+                    lines.append(f"❌ Error descargando {tipo}: {response.status_code}")
+                    return False, lines
                 
         except Exception as e:
-            print(f"❌ Error descargando {filename}: {str(e)}")
-            return False
+            lines.append(f"❌ Error descargando {filename}: {str(e)}")
+            return False, lines
     
     def print_report_summary(self, result: dict) -> None:
         """Imprimir resumen del reporte generado"""
         if not result:
             return
         
-        print("\n" + "="*60)
-        print("📊 RESUMEN DEL REPORTE GENERADO")
-        print("="*60)
+        # El resumen se arma como lista de líneas y se imprime de una vez
+        lines = [
+            "\n" + "="*60,
+            "📊 RESUMEN DEL REPORTE GENERADO",
+            "="*60
+        ]
         
         # Información general
-        print(f"📅 Período: {result.get('periodo', 'N/A')}")
-        print(f"🕐 Timestamp: {result.get('timestamp', 'N/A')}")
-        print(f"📋 Formato: {result.get('formato_solicitado', 'N/A')}")
+        lines += [
+            f"📅 Período: {result.get('periodo', 'N/A')}",
+            f"🕐 Timestamp: {result.get('timestamp', 'N/A')}",
+            f"📋 Formato: {result.get('formato_solicitado', 'N/A')}"
+        ]
         
         # Datos procesados
         datos = result.get('datos_procesados', {})
-        print(f"\n📈 DATOS PROCESADOS:")
-        print(f"   • Campañas: {datos.get('campañas', 0):,}")
-        print(f"   • Gestiones: {datos.get('gestiones', 0):,}")
-        print(f"   • Pagos: {datos.get('pagos', 0):,}")
-        print(f"   • KPIs por campaña: {datos.get('kpis_campania', 0)}")
+        lines += [
+            f"\n📈 DATOS PROCESADOS:",
+            f"   • Campañas: {datos.get('campañas', 0):,}",
+            f"   • Gestiones: {datos.get('gestiones', 0):,}",
+            f"   • Pagos: {datos.get('pagos', 0):,}",
+            f"   • KPIs por campaña: {datos.get('kpis_campania', 0)}"
+        ]
         
         # Resumen ejecutivo
         resumen = result.get('resumen_ejecutivo', {})
         if resumen:
-            print(f"\n🎯 RESUMEN EJECUTIVO:")
-            print(f"   • Total gestiones: {resumen.get('total_gestiones', 0):,}")
-            print(f"   • Contactos efectivos: {resumen.get('contactos_efectivos', 0):,}")
-            print(f"   • Tasa contactabilidad: {resumen.get('tasa_contactabilidad', 0):.2f}%")
-            print(f"   • Compromisos: {resumen.get('compromisos', 0):,}")
-            print(f"   • Monto compromisos: ${resumen.get('monto_compromisos', 0):,.0f}")
+            lines += [
+                f"\n🎯 RESUMEN EJECUTIVO:",
+                f"   • Total gestiones: {resumen.get('total_gestiones', 0):,}",
+                f"   • Contactos efectivos: {resumen.get('contactos_efectivos', 0):,}",
+                f"   • Tasa contactabilidad: {resumen.get('tasa_contactabilidad', 0):.2f}%",
+                f"   • Compromisos: {resumen.get('compromisos', 0):,}",
+                f"   • Monto compromisos: ${resumen.get('monto_compromisos', 0):,.0f}"
+            ]
         
         # Archivos generados
         archivos = result.get('archivos_generados', {})
         if archivos:
-            print(f"\n📁 ARCHIVOS GENERADOS:")
-            for tipo, info in archivos.items():
-                print(f"   • {tipo.upper()}: {info['filename']} ({info['size_mb']} MB)")
+            lines.append(f"\n📁 ARCHIVOS GENERADOS:")
+            lines += [
+                f"   • {tipo.upper()}: {info['filename']} ({info['size_mb']} MB)"
+                for tipo, info in archivos.items()
+            ]
         
         # Enlaces de descarga
         enlaces = result.get('enlaces_descarga', {})
         if enlaces:
-            print(f"\n🔗 ENLACES DE DESCARGA:")
-            for tipo, url in enlaces.items():
-                print(f"   • {tipo.upper()}: {url}")
+            lines.append(f"\n🔗 ENLACES DE DESCARGA:")
+            lines += [f"   • {tipo.upper()}: {url}" for tipo, url in enlaces.items()]
+        
+        print("\n".join(lines))
     
     def run_test_suite(self, 
                       fecha_inicio: Optional[str] = None,
@@ -188,13 +247,16 @@ class FacoReportsTester:
         print("🧪 INICIANDO SUITE DE PRUEBAS FACO WEEKLY")
         print("="*50)
         
+        # Health y vigencias en una sola llamada si el servidor soporta /batch
+        batch = self.batch_probe(["/health", "/vigencias-status"])
+        
         # 1. Verificar salud del sistema
-        if not self.check_health():
+        if not self.check_health(batch):
             return False
         
         # 2. Obtener estado de vigencias
         print(f"\n📋 Verificando estado de vigencias...")
-        vigencias = self.get_vigencias_status()
+        vigencias = self.get_vigencias_status(batch)
         if vigencias:
             resumen = vigencias.get('resumen', {})
             print(f"   • Total campañas: {resumen.get('total_campañas', 0)}")
@@ -204,8 +266,8 @@ class FacoReportsTester:
         # 3. Definir período de prueba si no se proporciona
         if not fecha_inicio or not fecha_fin:
             # Usar última semana como período por defecto
-            fecha_fin = datetime.now().strftime('%Y-%m-%d')
-            fecha_inicio = (datetime.now() - timedelta(days=10)).strftime('%Y-%m-%d')
+            fecha_fin = date.today().isoformat()
+            fecha_inicio = (date.today() - timedelta(days=10)).isoformat()
             print(f"\n📅 Usando período por defecto: {fecha_inicio} a {fecha_fin}")
         
         # 4. Generar reportes
@@ -227,11 +289,24 @@ class FacoReportsTester:
         
         if enlaces:
             print(f"\n📥 Descargando {total_downloads} archivo(s)...")
+            os.makedirs(self.output_dir, exist_ok=True)
             
-            for tipo, url in enlaces.items():
-                filename = archivos[tipo]['filename']
-                if self.download_file(url, filename, tipo):
-                    success_downloads += 1
+            def descargar(enlace):
+                # requests.Session no garantiza ser thread-safe: una sesión por hilo
+                import requests
+                
+                tipo, url = enlace
+                with requests.Session() as session:
+                    return self._download(session, url, archivos[tipo]['filename'], tipo)
+            
+            # Las descargas son independientes: se hacen en paralelo y la salida
+            # de cada una se imprime después, en el orden de enlaces
+            with ThreadPoolExecutor(max_workers=total_downloads) as executor:
+                resultados = list(executor.map(descargar, enlaces.items()))
+            
+            for ok, lines in resultados:
+                print("\n".join(lines))
+            success_downloads = sum(ok for ok, _ in resultados)
         
         # 7. Resumen final
         print(f"\n🎉 PRUEBAS COMPLETADAS")
@@ -247,6 +322,9 @@ class FacoReportsTester:
 
 def main():
     """Función principal"""
+    # argparse solo se necesita al ejecutar como CLI, no al importar el tester
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="Script de prueba para generación de reportes FACO Weekly",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -277,8 +355,8 @@ Ejemplos de uso:
     
     # Configurar fechas según período
     if args.periodo == 'semanal':
-        fecha_fin = datetime.now().strftime('%Y-%m-%d')
-        fecha_inicio = (datetime.now() - timedelta(days=10)).strftime('%Y-%m-%d')
+        fecha_fin = date.today().isoformat()
+        fecha_inicio = (date.today() - timedelta(days=10)).isoformat()
     else:
         fecha_inicio = args.inicio
         fecha_fin = args.fin
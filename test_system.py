@@ -7,10 +7,37 @@ Script de prueba para verificar que el sistema funciona correctamente
 sin errores de compilación y con todas las dependencias instaladas.
 """
 
+import io
 import sys
-import os
-import traceback
-from datetime import datetime, timedelta
+import importlib
+import logging
+from datetime import datetime
+from functools import lru_cache
+
+logger = logging.getLogger(__name__)
+
+# Dependencias opcionales: se importan una sola vez y cada test revisa su flag
+try:
+    import xlsxwriter
+    HAS_XLSXWRITER = True
+except ImportError:
+    HAS_XLSXWRITER = False
+
+try:
+    from pptx import Presentation
+    HAS_PPTX = True
+except ImportError:
+    HAS_PPTX = False
+
+try:
+    import pandas as pd
+    import numpy as np
+    HAS_PANDAS = True
+except ImportError:
+    HAS_PANDAS = False
+
+# Semilla fija para los datos dummy (resultados reproducibles entre corridas)
+RANDOM_SEED = 0
 
 def test_basic_imports():
     """Test 1: Verificar imports básicos"""
@@ -52,16 +79,25 @@ def test_basic_imports():
     
     return True
 
+@lru_cache(maxsize=1)
+def _get_generator():
+    """Instancia compartida del generador (los tests solo la leen)"""
+    from report_generator import TelefonicaReportGenerator
+    return TelefonicaReportGenerator("2025-06-01", "2025-06-12")
+
+@lru_cache(maxsize=1)
+def _get_main_module():
+    """Módulo main importado una sola vez"""
+    return importlib.import_module('main')
+
 def test_report_generator():
     """Test 2: Verificar generador de reportes"""
     print("\n🔍 Test 2: Verificando generador de reportes...")
     
     try:
-        from report_generator import TelefonicaReportGenerator
+        # Importar y crear instancia (cacheada entre invocaciones)
+        generator = _get_generator()
         print("  ✅ Import TelefonicaReportGenerator: OK")
-        
-        # Crear instancia
-        generator = TelefonicaReportGenerator("2025-06-01", "2025-06-12")
         print("  ✅ Instancia creada: OK")
         
         # Verificar estructura de datos
@@ -71,9 +107,8 @@ def test_report_generator():
         
         return True
         
-    except Exception as e:
-        print(f"  ❌ Error en generador: {e}")
-        print(f"  📝 Traceback: {traceback.format_exc()}")
+    except Exception:
+        logger.exception("  ❌ Error en generador")
         return False
 
 def test_main_api():
@@ -81,7 +116,7 @@ def test_main_api():
     print("\n🔍 Test 3: Verificando API principal...")
     
     try:
-        import main
+        main = _get_main_module()
         print("  ✅ Import main: OK")
         
         # Verificar que la app existe
@@ -90,42 +125,35 @@ def test_main_api():
         
         return True
         
-    except Exception as e:
-        print(f"  ❌ Error en main: {e}")
-        print(f"  📝 Traceback: {traceback.format_exc()}")
+    except Exception:
+        logger.exception("  ❌ Error en main")
         return False
 
 def test_dummy_excel_generation():
     """Test 4: Verificar generación de Excel dummy"""
     print("\n🔍 Test 4: Verificando generación de Excel dummy...")
     
+    if not HAS_XLSXWRITER:
+        print("  ❌ XlsxWriter no instalado")
+        return False
+    
     try:
-        import openpyxl
-        import tempfile
-        import os
-        
-        # Crear archivo Excel de prueba
-        wb = openpyxl.Workbook()
-        ws = wb.active
-        ws.title = "Test Sheet"
+        # Crear Excel de prueba en memoria, con el mismo motor que usa
+        # report_generator (sin archivos temporales que limpiar)
+        buf = io.BytesIO()
+        wb = xlsxwriter.Workbook(buf, {'in_memory': True})
+        ws = wb.add_worksheet("Test Sheet")
         
         # Agregar algunos datos
-        ws['A1'] = "FACO Weekly Test"
-        ws['A2'] = f"Generado: {datetime.now().strftime('%Y-%m-%d %H:%M')}"
-        ws['A3'] = "Estado: Funcionando correctamente"
+        ws.write_string(0, 0, "FACO Weekly Test")
+        ws.write_string(1, 0, f"Generado: {datetime.now().strftime('%Y-%m-%d %H:%M')}")
+        ws.write_string(2, 0, "Estado: Funcionando correctamente")
+        wb.close()
         
-        # Guardar en directorio temporal
-        temp_dir = tempfile.gettempdir()
-        test_file = os.path.join(temp_dir, "faco_test.xlsx")
-        wb.save(test_file)
-        
-        # Verificar que existe
-        if os.path.exists(test_file):
-            file_size = os.path.getsize(test_file)
-            print(f"  ✅ Excel generado: {test_file} ({file_size} bytes)")
-            
-            # Limpiar archivo de prueba
-            os.remove(test_file)
+        # Verificar que se generó contenido
+        file_size = buf.getbuffer().nbytes
+        if file_size > 0:
+            print(f"  ✅ Excel generado en memoria ({file_size} bytes)")
             return True
         else:
             print("  ❌ No se pudo generar el archivo Excel")
@@ -139,11 +167,11 @@ def test_dummy_powerpoint_generation():
     """Test 5: Verificar generación de PowerPoint dummy"""
     print("\n🔍 Test 5: Verificando generación de PowerPoint dummy...")
     
+    if not HAS_PPTX:
+        print("  ❌ Python-PPTX no instalado")
+        return False
+    
     try:
-        from pptx import Presentation
-        import tempfile
-        import os
-        
         # Crear presentación de prueba
         prs = Presentation()
         
@@ -155,18 +183,14 @@ def test_dummy_powerpoint_generation():
         title.text = "FACO Weekly Test"
         subtitle.text = f"Sistema funcionando correctamente\\n{datetime.now().strftime('%Y-%m-%d %H:%M')}"
         
-        # Guardar en directorio temporal
-        temp_dir = tempfile.gettempdir()
-        test_file = os.path.join(temp_dir, "faco_test.pptx")
-        prs.save(test_file)
+        # Guardar en memoria
+        buf = io.BytesIO()
+        prs.save(buf)
         
-        # Verificar que existe
-        if os.path.exists(test_file):
-            file_size = os.path.getsize(test_file)
-            print(f"  ✅ PowerPoint generado: {test_file} ({file_size} bytes)")
-            
-            # Limpiar archivo de prueba
-            os.remove(test_file)
+        # Verificar que se generó contenido
+        file_size = buf.getbuffer().nbytes
+        if file_size > 0:
+            print(f"  ✅ PowerPoint generado en memoria ({file_size} bytes)")
             return True
         else:
             print("  ❌ No se pudo generar el archivo PowerPoint")
@@ -180,36 +204,47 @@ def test_data_processing():
     """Test 6: Verificar procesamiento de datos dummy"""
     print("\n🔍 Test 6: Verificando procesamiento de datos dummy...")
     
+    if not HAS_PANDAS:
+        print("  ❌ Pandas/NumPy no instalados")
+        return False
+    
     try:
-        import pandas as pd
-        import numpy as np
-        
         # Crear datos dummy para prueba
+        rng = np.random.default_rng(RANDOM_SEED)
         gestiones_dummy = pd.DataFrame({
-            'canal': ['CALL', 'VOICEBOT', 'CALL', 'VOICEBOT'] * 100,
-            'contactabilidad': ['CONTACTO_EFECTIVO', 'NO_CONTACTO', 'CONTACTO_EFECTIVO', 'CONTACTO_NO_EFECTIVO'] * 100,
-            'es_pdp': ['SI', 'NO', 'SI', 'NO'] * 100,
-            'cod_luna': range(400),
-            'monto_compromiso': np.random.uniform(10, 1000, 400),
-            'date': pd.date_range('2025-06-01', periods=400, freq='H'),
-            'duracion': np.random.uniform(30, 180, 400)
+            'canal': np.tile(np.array(['CALL', 'VOICEBOT'], dtype=object), 200),
+            'contactabilidad': np.tile(np.array(['CONTACTO_EFECTIVO', 'NO_CONTACTO', 'CONTACTO_EFECTIVO', 'CONTACTO_NO_EFECTIVO'], dtype=object), 100),
+            'es_pdp': np.tile(np.array(['SI', 'NO'], dtype=object), 200),
+            'cod_luna': np.arange(400, dtype=np.int32),
+            'monto_compromiso': rng.uniform(10, 1000, 400)
         })
         
         print(f"  ✅ DataFrame dummy creado: {len(gestiones_dummy)} registros")
         
-        # Procesar datos básicos
-        call_data = gestiones_dummy[gestiones_dummy['canal'] == 'CALL']
-        voicebot_data = gestiones_dummy[gestiones_dummy['canal'] == 'VOICEBOT']
+        # canal/contactabilidad quedan como texto, no category: agrupar por
+        # categóricas sin observed=True genera el producto cartesiano de
+        # categorías (pandas #24333, #32976). Si se agrega un groupby aquí,
+        # pasar siempre observed=True.
+        for col in ('canal', 'contactabilidad'):
+            assert not isinstance(gestiones_dummy[col].dtype, pd.CategoricalDtype), \
+                f"'{col}' no debe ser categórica en este test"
+        
+        # Procesar datos básicos: una sola tabla canal x contactabilidad
+        counts = pd.crosstab(gestiones_dummy['canal'], gestiones_dummy['contactabilidad'])
+        counts = counts.reindex(index=['CALL', 'VOICEBOT'], fill_value=0)
+        total_por_canal = counts.sum(axis=1)
         
-        call_contactos = len(call_data[call_data['contactabilidad'] == 'CONTACTO_EFECTIVO'])
-        voicebot_contactos = len(voicebot_data[voicebot_data['contactabilidad'] == 'CONTACTO_EFECTIVO'])
+        call_contactos = int(counts.loc['CALL', 'CONTACTO_EFECTIVO'])
+        voicebot_contactos = int(counts.loc['VOICEBOT', 'CONTACTO_EFECTIVO'])
+        n_call = int(total_por_canal['CALL'])
+        n_voicebot = int(total_por_canal['VOICEBOT'])
         
         print(f"  ✅ CALL contactos efectivos: {call_contactos}")
         print(f"  ✅ VOICEBOT contactos efectivos: {voicebot_contactos}")
         
         # Calcular tasas
-        tasa_call = round(call_contactos / len(call_data) * 100, 2) if len(call_data) > 0 else 0
-        tasa_voicebot = round(voicebot_contactos / len(voicebot_data) * 100, 2) if len(voicebot_data) > 0 else 0
+        tasa_call = round(call_contactos / n_call * 100, 2) if n_call > 0 else 0
+        tasa_voicebot = round(voicebot_contactos / n_voicebot * 100, 2) if n_voicebot > 0 else 0
         
         print(f"  ✅ Tasa contactabilidad CALL: {tasa_call}%")
         print(f"  ✅ Tasa contactabilidad VOICEBOT: {tasa_voicebot}%")
@@ -220,43 +255,47 @@ def test_data_processing():
         print(f"  ❌ Error procesando datos: {e}")
         return False
 
+# Suite en orden de ejecución: (nombre, función)
+TESTS = (
+    ('test_basic_imports', test_basic_imports),
+    ('test_report_generator', test_report_generator),
+    ('test_main_api', test_main_api),
+    ('test_dummy_excel_generation', test_dummy_excel_generation),
+    ('test_dummy_powerpoint_generation', test_dummy_powerpoint_generation),
+    ('test_data_processing', test_data_processing),
+)
+
 def main():
     """Ejecutar todos los tests"""
+    # Tracebacks de los tests en el mismo stream que el reporte
+    logging.basicConfig(level=logging.INFO, format='%(message)s', stream=sys.stdout)
+    
     print("=" * 60)
     print("🧪 FACO WEEKLY - SUITE DE PRUEBAS")
     print("Verificando sistema sin errores de compilación")
     print("=" * 60)
     
-    tests = [
-        test_basic_imports,
-        test_report_generator,
-        test_main_api,
-        test_dummy_excel_generation,
-        test_dummy_powerpoint_generation,
-        test_data_processing
-    ]
-    
     results = []
     
-    for test in tests:
+    for name, test in TESTS:
         try:
             result = test()
-            results.append(result)
         except Exception as e:
             print(f"❌ Test falló con excepción: {e}")
-            results.append(False)
+            result = False
+        results.append((name, result))
     
     # Resumen final
     print("\n" + "=" * 60)
     print("📊 RESUMEN DE PRUEBAS")
     print("=" * 60)
     
-    passed = sum(results)
+    passed = sum(1 for _, result in results if result)
     total = len(results)
     
-    for i, (test, result) in enumerate(zip(tests, results), 1):
+    for i, (name, result) in enumerate(results, 1):
         status = "✅ PASSED" if result else "❌ FAILED"
-        print(f"Test {i}: {test.__name__} - {status}")
+        print(f"Test {i}: {name} - {status}")
     
     print(f"\n🎯 Resultado: {passed}/{total} pruebas exitosas")
     